@@ -13,11 +13,12 @@ Dependencies: tkinter (stdlib only)
 
 import tkinter as tk
 from tkinter import messagebox, filedialog
-import threading
+import array
+import gzip
 import time
-import random
 import pickle
 import os
+import struct
 import sys
 from typing import Optional, List, Set
 from dataclasses import dataclass
@@ -67,6 +68,10 @@ class EmulatorConfig:
     quirk_clipping: bool = True           # Sprites clip at screen edge
     quirk_shifting: bool = False          # 8XY6/8XYE use VY (VIP) vs VX (CHIP-48)
     quirk_jumping: bool = False           # BNNN uses VX (CHIP-48) vs V0 (VIP)
+    
+    # Performance
+    superinstructions: bool = True        # Fuse common opcode sequences
+    compile_blocks: bool = True           # Compile straight-line ALU runs
 
 # Window constants
 WINDOW_WIDTH = 640
@@ -74,6 +79,16 @@ WINDOW_HEIGHT = 400
 DISPLAY_AREA_HEIGHT = 352
 STATUS_BAR_HEIGHT = 48
 
+# Renderer row encoding: pixel bytes 0/1 -> ASCII '0'/'1', expanded to
+# colors on the Tcl side by PUT_ROWS_PROC
+PIXEL_CHARS = bytes.maketrans(b'\x00\x01', b'01')
+PUT_ROWS_PROC = """
+proc chip8_put_rows {img y rows} {
+    global chip8_pixel_map
+    $img put [string map $chip8_pixel_map $rows] -to 0 $y
+}
+"""
+
 # Colors
 COLORS = {
     'bg': '#0C0C0C',
@@ -132,6 +147,118 @@ FONT_8X10 = bytes([
     0x3C, 0x7E, 0xC3, 0xC3, 0x7F, 0x3F, 0x03, 0x03, 0x3E, 0x7C,
 ])
 
+# ============================================================================
+# DECODE & SPRITE LOOKUP TABLES
+# ============================================================================
+
+# Big-endian 16-bit opcode fetch: (opcode,) = FETCH_OPCODE(memory, pc)
+FETCH_OPCODE = struct.Struct('>H').unpack_from
+
+# Longest straight-line run compiled into one Python function
+MAX_BLOCK_OPS = 16
+
+# Longest span of memory covered by one decode-cache entry
+MAX_ENTRY_BYTES = 2 * MAX_BLOCK_OPS
+
+# Chip8CPU._status bits: any set bit stops execution
+STATUS_HALTED = 0x1             # CPU halted (error state)
+STATUS_WAITING = 0x2            # FX0A blocking
+
+# Column offsets of the set bits in each sprite byte (MSB = column 0)
+SPRITE_COLUMNS = tuple(
+    tuple(col for col in range(8) if byte & (0x80 >> col))
+    for byte in range(256)
+)
+
+# Each sprite byte deposited into 8 pixel bytes (one per column) and read
+# as a big-endian 64-bit word, for XORing a whole framebuffer row span
+SPRITE_ROW_WORDS = tuple(
+    int.from_bytes(bytes((byte >> (7 - col)) & 1 for col in range(8)), 'big')
+    for byte in range(256)
+)
+
+# ============================================================================
+# SPRITE BLIT KERNELS
+# ============================================================================
+
+# DXYN hot loops, kept free of attribute lookups: they only touch their
+# arguments (raw framebuffer/memory buffers and plain ints) and locals.
+
+def blit_8xn(display: bytearray, memory: bytearray, addr: int,
+             vx: int, vy: int, n: int, width: int, height: int,
+             stride: int, clip: bool) -> int:
+    """XOR an 8xN sprite at memory[addr] into display; return 1 on collision"""
+    # Resolve the clipping quirk once per sprite: clip drops off-screen
+    # rows and columns, wrap folds both modulo the screen
+    if clip:
+        row_bases = [(vy + row) * stride for row in range(min(n, height - vy))]
+    else:
+        row_bases = [((vy + row) % height) * stride for row in range(n)]
+    
+    # Pixels 0..head-1 land before the right edge; when wrapping, the
+    # remaining tail pixels continue at column 0 of the same row
+    head = min(8, width - vx)
+    tail = 0 if clip else 8 - head
+    head_shift = 8 * (8 - head)
+    tail_mask = (1 << (8 * tail)) - 1
+    
+    # XOR each sprite row as one word of 0/1 bytes (SWAR)
+    collide = 0
+    for row, row_base in enumerate(row_bases):
+        sprite = SPRITE_ROW_WORDS[memory[addr + row]]
+        if not sprite:
+            continue
+        
+        off = row_base + vx
+        bits = sprite >> head_shift
+        pixels = int.from_bytes(display[off:off + head], 'big')
+        collide |= pixels & bits
+        display[off:off + head] = (pixels ^ bits).to_bytes(head, 'big')
+        
+        if tail:
+            bits = sprite & tail_mask
+            pixels = int.from_bytes(display[row_base:row_base + tail], 'big')
+            collide |= pixels & bits
+            display[row_base:row_base + tail] = (pixels ^ bits).to_bytes(tail, 'big')
+    
+    return 1 if collide else 0
+
+
+def blit_16x16(display: bytearray, memory: bytearray, addr: int,
+               vx: int, vy: int, width: int, height: int,
+               stride: int) -> int:
+    """XOR a SUPER-CHIP 16x16 sprite into display; return 1 on collision"""
+    collide = 0
+    
+    if vx + 16 <= width:
+        # Sprite row fits on screen: XOR both halves as one 128-bit word
+        for row in range(16):
+            off = ((vy + row) % height) * stride + vx
+            sprite = (SPRITE_ROW_WORDS[memory[addr + row * 2]] << 64) | \
+                     SPRITE_ROW_WORDS[memory[addr + row * 2 + 1]]
+            pixels = int.from_bytes(display[off:off + 16], 'big')
+            collide |= pixels & sprite
+            display[off:off + 16] = (pixels ^ sprite).to_bytes(16, 'big')
+        return 1 if collide else 0
+    
+    # 16x16 sprites always wrap
+    cols = [(vx + col) % width for col in range(16)]
+    
+    for row in range(16):
+        row_base = ((vy + row) % height) * stride
+        
+        # 2 bytes per row: left half then right half
+        left = memory[addr + row * 2]
+        right = memory[addr + row * 2 + 1]
+        
+        for half, sprite_byte in ((0, left), (8, right)):
+            for col in SPRITE_COLUMNS[sprite_byte]:
+                idx = row_base + cols[half + col]
+                collide |= display[idx]
+                display[idx] ^= 1
+    
+    return collide
+
 # ============================================================================
 # KEYBOARD MAPPING
 # ============================================================================
@@ -157,18 +284,20 @@ KEYBOARD_MAP = {
 class EmulatorState:
     """Complete serializable emulator state for save/load"""
     memory: bytes
-    v: List[int]
+    v: bytes
     i: int
     pc: int
     stack: List[int]
     sp: int
     delay_timer: int
     sound_timer: int
-    display: List[List[int]]
+    display: bytes
     keys: List[bool]
     hires_mode: bool
     # SUPER-CHIP
     rpl_flags: List[int]
+    # CXNN random generator state
+    rng_state: int = 0
 
 # ============================================================================
 # CHIP-8 CPU - COMPLETE IMPLEMENTATION
@@ -188,6 +317,11 @@ class Chip8CPU:
     
     def __init__(self, config: EmulatorConfig = None):
         self.config = config or EmulatorConfig()
+        
+        # Decoded-instruction cache: PC -> (handler, operand tuple)
+        # Created once so batch loops can hold a reference across resets
+        self._decoded = {}
+        
         self.reset()
     
     def reset(self):
@@ -198,13 +332,11 @@ class Chip8CPU:
         self.memory = bytearray(cfg.memory_size)
         
         # Load fonts into memory
-        for i, byte in enumerate(FONT_4X5):
-            self.memory[cfg.font_start + i] = byte
-        for i, byte in enumerate(FONT_8X10):
-            self.memory[cfg.hires_font_start + i] = byte
+        self.memory[cfg.font_start:cfg.font_start + len(FONT_4X5)] = bytes(FONT_4X5)
+        self.memory[cfg.hires_font_start:cfg.hires_font_start + len(FONT_8X10)] = bytes(FONT_8X10)
         
         # 16 general-purpose 8-bit registers V0-VF
-        self.v = [0] * cfg.num_registers
+        self.v = bytearray(cfg.num_registers)
         
         # 16-bit index register
         self.i = 0
@@ -213,7 +345,7 @@ class Chip8CPU:
         self.pc = cfg.program_start
         
         # Stack (16 levels of 16-bit addresses)
-        self.stack = [0] * cfg.stack_size
+        self.stack = array.array('H', [0] * cfg.stack_size)
         self.sp = 0
         
         # Timers (decrement at 60Hz when non-zero)
@@ -222,19 +354,25 @@ class Chip8CPU:
         
         # Display buffer
         # Low-res: 64x32, High-res: 128x64
+        # Flat row-major framebuffer sized for high-res; pixel (x, y) lives at
+        # display[y * stride + x]. Low-res uses the top-left 64x32 region.
         self.display_width = cfg.lores_width
         self.display_height = cfg.lores_height
-        self.display = [[0] * cfg.hires_width for _ in range(cfg.hires_height)]
+        self.stride = cfg.hires_width
+        self.display = bytearray(cfg.hires_width * cfg.hires_height)
+        self._blank = memoryview(bytes(len(self.display)))  # Zero source for clears
+        self.all_rows = (1 << cfg.hires_height) - 1
         self.hires_mode = False
+        self.hires_changed = True        # Renderer must match display mode
         
-        # Input state (16 keys)
-        self.keys = [False] * cfg.num_keys
+        # Input state (16 keys, 1 = pressed)
+        self.keys = bytearray(cfg.num_keys)
         
         # CPU state flags
         self.draw_flag = False           # Screen needs redraw
-        self.waiting_for_key = False     # FX0A blocking
+        self.dirty_rows = 0              # Bit y set: display row y changed
+        self._status = 0                 # STATUS_* bits (halted, waiting_for_key)
         self.key_register = 0            # Register to store key for FX0A
-        self.halted = False              # CPU halted (error state)
         
         # SUPER-CHIP RPL user flags (8 bytes, persisted)
         self.rpl_flags = [0] * 8
@@ -246,6 +384,49 @@ class Chip8CPU:
         
         # Cycle counter for timing
         self.cycles = 0
+        
+        # CXNN random source: 32-bit LCG state (see seed())
+        self._rng = int(time.time() * 1e6) & 0xFFFFFFFF
+        
+        # Config fields read by opcode handlers, hoisted to save a lookup
+        self._memory_size = cfg.memory_size
+        self._stack_size = cfg.stack_size
+        self._font_start = cfg.font_start
+        self._hires_font_start = cfg.hires_font_start
+        self._quirk_vf_reset = cfg.quirk_vf_reset
+        self._quirk_clipping = cfg.quirk_clipping
+        
+        # Opcode jump tables
+        self._build_dispatch()
+        self._decoded.clear()
+    
+    @property
+    def halted(self) -> bool:
+        """CPU halted (error state)"""
+        return bool(self._status & STATUS_HALTED)
+    
+    @halted.setter
+    def halted(self, value: bool):
+        if value:
+            self._status |= STATUS_HALTED
+        else:
+            self._status &= ~STATUS_HALTED
+    
+    @property
+    def waiting_for_key(self) -> bool:
+        """FX0A blocking until a key is pressed"""
+        return bool(self._status & STATUS_WAITING)
+    
+    @waiting_for_key.setter
+    def waiting_for_key(self, value: bool):
+        if value:
+            self._status |= STATUS_WAITING
+        else:
+            self._status &= ~STATUS_WAITING
+    
+    def seed(self, value: int):
+        """Seed the CXNN random generator (deterministic replay)"""
+        self._rng = value & 0xFFFFFFFF
     
     def load_rom(self, data: bytes, name: str = ""):
         """Load ROM into memory starting at 0x200"""
@@ -255,8 +436,8 @@ class Chip8CPU:
         if len(data) > max_size:
             raise ValueError(f"ROM too large: {len(data)} bytes (max {max_size})")
         
-        for i, byte in enumerate(data):
-            self.memory[self.config.program_start + i] = byte
+        start = self.config.program_start
+        self.memory[start:start + len(data)] = data
         
         self.rom_loaded = True
         self.rom_name = name or "Unknown"
@@ -264,30 +445,60 @@ class Chip8CPU:
     
     def cycle(self) -> bool:
         """
-        Execute one CPU cycle.
+        Execute one CPU cycle (exactly one opcode: with a budget of 1,
+        run_batch skips blocks and superinstructions).
         Returns True if instruction executed, False if waiting.
         """
-        if self.halted:
-            return False
-        
-        if self.waiting_for_key:
-            return False
-        
-        # Fetch opcode (big-endian 16-bit)
-        if self.pc >= self.config.memory_size - 1:
-            self.halted = True
-            return False
-        
-        opcode = (self.memory[self.pc] << 8) | self.memory[self.pc + 1]
-        
-        # Decode and execute
-        self._execute(opcode)
-        self.cycles += 1
+        return self.run_batch(1) > 0
+    
+    def run_batch(self, n: int) -> int:
+        """
+        Execute up to n CPU cycles in a single call.
+        Stops early if the CPU halts or blocks on FX0A.
+        Returns the number of instructions executed.
+        """
+        # Bind loop-invariant lookups to locals once per batch
+        lookup = self._decoded.get
+        decode = self._decode_and_cache
+        executed = 0
         
-        return True
+        try:
+            while executed < n:
+                if self._status:
+                    break
+                
+                # Fetch + decode once per address, then reuse
+                pc = self.pc
+                entry = lookup(pc) or decode(pc, n)
+                if entry is None:
+                    break
+                
+                handler, args, ops, single = entry
+                if ops > n - executed:
+                    if ops > n > 1:
+                        # Built for a larger batch (speed lowered): rebuild to fit
+                        handler, args, ops, single = decode(pc, n)
+                    if ops > n - executed:
+                        # Multi-opcode entry would overrun the budget: step one opcode
+                        handler, args = single
+                ran = handler(*args)
+                if ran is None:
+                    executed += 1
+                elif ran:
+                    # Superinstruction: stands in for several opcodes
+                    executed += ran
+                else:
+                    # Idle wait loop: the rest of this slice would only spin.
+                    # Only its FX07 ran; stop without charging the spin.
+                    executed += 1
+                    break
+        finally:
+            # Count opcodes that ran even if one of them raised
+            self.cycles += executed
+        return executed
     
-    def _execute(self, opcode: int):
-        """Decode and execute a single opcode"""
+    def _decode(self, opcode: int):
+        """Decode an opcode into its handler and operand fields"""
         # Extract common fields
         nnn = opcode & 0x0FFF           # 12-bit address
         nn = opcode & 0x00FF            # 8-bit constant
@@ -295,308 +506,608 @@ class Chip8CPU:
         x = (opcode >> 8) & 0x0F        # Register X index
         y = (opcode >> 4) & 0x0F        # Register Y index
         
-        # First nibble determines instruction class
+        if opcode & 0xFF00 == 0x0000:
+            # 00NN control opcodes resolve straight to their handler
+            handler = self._dispatch_0.get(opcode)
+            if handler is not None:
+                return handler, ()
+            if nn & 0xF0 == 0xC0:
+                return self._scroll_down, (n,)
+            if nn & 0xF0 == 0xD0:
+                return self._scroll_up, (n,)
+        
+        # First nibble indexes the instruction class handler
+        return self._dispatch[opcode >> 12], (opcode, nnn, nn, n, x, y)
+    
+    def _decode_and_cache(self, pc: int, limit: int):
+        """
+        Fetch and decode the opcode at PC, caching the result.
+        Multi-opcode entries cover at most limit opcodes (the batch size),
+        so they can run whole when a batch starts on them.
+        """
+        # Fetch opcode (big-endian 16-bit)
+        if pc >= self._memory_size - 1:
+            self.halted = True
+            return None
+        
+        (opcode,) = FETCH_OPCODE(self.memory, pc)
+        single = self._decode(opcode)
+        
+        # Entries are (handler, args, ops, single): ops is the number of
+        # opcodes the handler stands in for, single the plain decode of the
+        # first one, run instead when fewer than ops cycles remain
+        entry = None
+        if self.config.compile_blocks and limit >= 2:
+            entry = self._compile_block(pc, min(limit, MAX_BLOCK_OPS))
+        if entry is None and self.config.superinstructions:
+            entry = self._fuse(pc, opcode)
+            if entry is not None and entry[2] > limit:
+                entry = None
+        if entry is None:
+            entry = single + (1, None)
+        else:
+            entry += (single,)
+        
+        self._decoded[pc] = entry
+        return entry
+    
+    def _check_span(self, start: int, length: int):
+        """Raise IndexError if memory[start:start + length] runs past the end"""
+        # Slice assignment would silently resize the bytearray instead
+        if start + length > len(self.memory):
+            raise IndexError(f"memory access out of range: ${start:04X}+{length}")
+    
+    def _invalidate(self, start: int, length: int):
+        """Drop cached decodes overlapping memory[start:start + length]"""
+        decoded = self._decoded
+        if decoded:
+            # An entry starting up to MAX_ENTRY_BYTES - 1 bytes earlier
+            # may cover start (a plain opcode at start - 1 included)
+            for addr in range(start - MAX_ENTRY_BYTES + 1, start + length):
+                decoded.pop(addr, None)
+    
+    # ==================== SUPERINSTRUCTIONS ====================
+    
+    def _fuse(self, pc: int, opcode: int):
+        """
+        Recognize a common opcode sequence starting at PC.
+        Returns a fused (handler, args, ops) entry, or None.
+        
+        Fused handlers return the number of opcodes they stand in for,
+        or 0 when the program is idling and the batch should yield.
+        """
+        memory = self.memory
         op = opcode >> 12
         
-        # ==================== 0x0___ ====================
-        if op == 0x0:
-            if opcode == 0x00E0:
-                # 00E0: CLS - Clear the display
-                self._cls()
-            elif opcode == 0x00EE:
-                # 00EE: RET - Return from subroutine
-                self._ret()
-            elif opcode == 0x00FB:
-                # 00FB: SCR - Scroll right 4 pixels (SUPER-CHIP)
-                self._scroll_right()
-            elif opcode == 0x00FC:
-                # 00FC: SCL - Scroll left 4 pixels (SUPER-CHIP)
-                self._scroll_left()
-            elif opcode == 0x00FD:
-                # 00FD: EXIT - Exit interpreter (SUPER-CHIP)
-                self.halted = True
-                return
-            elif opcode == 0x00FE:
-                # 00FE: LOW - Disable high-res mode (SUPER-CHIP)
-                self._set_lores()
-            elif opcode == 0x00FF:
-                # 00FF: HIGH - Enable high-res mode (SUPER-CHIP)
-                self._set_hires()
-            elif (opcode & 0xFFF0) == 0x00C0:
-                # 00CN: SCD N - Scroll down N pixels (SUPER-CHIP)
-                self._scroll_down(n)
-            elif (opcode & 0xFFF0) == 0x00D0:
-                # 00DN: SCU N - Scroll up N pixels (XO-CHIP)
-                self._scroll_up(n)
-            elif (opcode & 0xF000) == 0x0000 and opcode != 0x0000:
-                # 0NNN: SYS addr - Call machine code routine (ignored on modern)
-                # Original COSMAC VIP: calls 1802 machine code at NNN
-                # Modern interpreters: NOP or ignored
-                self.pc += 2
-            else:
-                # 0000 or unknown - NOP
-                self.pc += 2
-        
-        # ==================== 0x1___ ====================
-        elif op == 0x1:
-            # 1NNN: JP addr - Jump to address NNN
-            self.pc = nnn
-        
-        # ==================== 0x2___ ====================
-        elif op == 0x2:
-            # 2NNN: CALL addr - Call subroutine at NNN
-            if self.sp >= self.config.stack_size:
-                self.halted = True  # Stack overflow
-                return
-            self.stack[self.sp] = self.pc
-            self.sp += 1
-            self.pc = nnn
-        
-        # ==================== 0x3___ ====================
-        elif op == 0x3:
-            # 3XNN: SE Vx, byte - Skip if Vx == NN
-            self.pc += 4 if self.v[x] == nn else 2
-        
-        # ==================== 0x4___ ====================
-        elif op == 0x4:
-            # 4XNN: SNE Vx, byte - Skip if Vx != NN
-            self.pc += 4 if self.v[x] != nn else 2
-        
-        # ==================== 0x5___ ====================
-        elif op == 0x5:
-            if n == 0x0:
-                # 5XY0: SE Vx, Vy - Skip if Vx == Vy
-                self.pc += 4 if self.v[x] == self.v[y] else 2
-            elif n == 0x2:
-                # 5XY2: SAVE Vx - Vy (XO-CHIP) - Store Vx-Vy to memory[I]
-                self._save_range(x, y)
-            elif n == 0x3:
-                # 5XY3: LOAD Vx - Vy (XO-CHIP) - Load Vx-Vy from memory[I]
-                self._load_range(x, y)
-            else:
-                self.pc += 2  # Unknown, skip
-        
-        # ==================== 0x6___ ====================
-        elif op == 0x6:
-            # 6XNN: LD Vx, byte - Set Vx = NN
-            self.v[x] = nn
-            self.pc += 2
+        if op == 0x6 or op == 0xA:
+            if pc + 4 > len(memory) - 1:
+                return None
+            (next_opcode,) = FETCH_OPCODE(memory, pc + 2)
+            
+            if op == 0x6 and (next_opcode >> 12) == 0x6:
+                # 6XNN 6YNN: two register loads
+                return self._fused_load2, (
+                    (opcode >> 8) & 0x0F, opcode & 0xFF,
+                    (next_opcode >> 8) & 0x0F, next_opcode & 0xFF,
+                ), 2
+            
+            if op == 0xA and (next_opcode >> 12) == 0xD:
+                # ANNN DXYN: point I at a sprite and draw it
+                return self._fused_draw, (
+                    opcode & 0x0FFF, (next_opcode >> 8) & 0x0F,
+                    (next_opcode >> 4) & 0x0F, next_opcode & 0x0F,
+                ), 2
+        
+        elif op == 0xF and (opcode & 0xFF) == 0x07:
+            if pc + 6 > len(memory) - 1:
+                return None
+            x = (opcode >> 8) & 0x0F
+            (skip,) = FETCH_OPCODE(memory, pc + 2)
+            (jump,) = FETCH_OPCODE(memory, pc + 4)
+            
+            if skip == (0x3000 | (x << 8)) and jump == (0x1000 | pc):
+                # FX07 3X00 1NNN(=PC): busy-wait for delay timer to expire
+                return self._fused_wait_delay, (x, pc), 3
+        
+        return None
+    
+    def _fused_load2(self, x1: int, nn1: int, x2: int, nn2: int):
+        """6XNN 6YNN: Set Vx = NN, Vy = NN"""
+        self.v[x1] = nn1
+        self.v[x2] = nn2
+        self.pc += 4
+        return 2
+    
+    def _fused_draw(self, nnn: int, x: int, y: int, n: int):
+        """ANNN DXYN: Set I = NNN, then draw sprite"""
+        self.i = nnn
+        self._draw(x, y, n)
+        self.pc += 4
+        return 2
+    
+    def _fused_wait_delay(self, x: int, pc: int):
+        """FX07 3X00 1NNN: Loop until the delay timer reads zero"""
+        self.v[x] = self.delay_timer
+        if self.v[x]:
+            # Timers tick between batches, so the loop cannot exit
+            # before then: stay on the loop and yield the slice
+            return 0
+        self.pc = pc + 6
+        return 3
+    
+    # ==================== BLOCK COMPILER ====================
+    
+    def _compile_block(self, pc: int, max_ops: int):
+        """
+        Compile the straight-line run of register-only opcodes starting
+        at PC, up to max_ops long, into one Python function with the
+        operations inlined.
+        Returns a (handler, args, ops) entry, or None if the run is
+        shorter than two opcodes.
         
-        # ==================== 0x7___ ====================
-        elif op == 0x7:
-            # 7XNN: ADD Vx, byte - Set Vx = Vx + NN (no carry flag)
-            self.v[x] = (self.v[x] + nn) & 0xFF
-            self.pc += 2
+        The handler returns the number of opcodes it executed.
+        """
+        memory = self.memory
+        end = len(memory) - 1
+        
+        body = []
+        addr = pc
+        count = 0
+        while count < max_ops and addr < end:
+            (opcode,) = FETCH_OPCODE(memory, addr)
+            lines = self._block_source(opcode)
+            if lines is None:
+                break
+            body.extend(lines)
+            addr += 2
+            count += 1
+        
+        if count < 2:
+            return None
+        
+        source = '\n    '.join([
+            'def block(cpu):',
+            'v = cpu.v',
+            *body,
+            f'cpu.pc = {addr}',
+            f'return {count}',
+        ])
+        namespace = {}
+        exec(compile(source, f'<block ${pc:03X}>', 'exec'), namespace)
+        return namespace['block'], (self,), count
+    
+    def _block_source(self, opcode: int) -> Optional[List[str]]:
+        """Python statements for one block-compilable opcode, else None"""
+        nnn = opcode & 0x0FFF
+        nn = opcode & 0x00FF
+        n = opcode & 0x000F
+        x = (opcode >> 8) & 0x0F
+        y = (opcode >> 4) & 0x0F
+        op = opcode >> 12
         
-        # ==================== 0x8___ ====================
-        elif op == 0x8:
-            self._execute_8xxx(x, y, n)
-        
-        # ==================== 0x9___ ====================
-        elif op == 0x9:
-            if n == 0x0:
-                # 9XY0: SNE Vx, Vy - Skip if Vx != Vy
-                self.pc += 4 if self.v[x] != self.v[y] else 2
-            else:
-                self.pc += 2  # Unknown
-        
-        # ==================== 0xA___ ====================
-        elif op == 0xA:
-            # ANNN: LD I, addr - Set I = NNN
-            self.i = nnn
-            self.pc += 2
+        if op == 0x6:
+            return [f'v[{x}] = {nn}']
+        if op == 0x7:
+            return [f'v[{x}] = (v[{x}] + {nn}) & 0xFF']
+        if op == 0x8:
+            return self._block_source_8(x, y, n)
+        if op == 0xA:
+            return [f'cpu.i = {nnn}']
+        if op == 0xC:
+            return ['r = cpu._rng = (cpu._rng * 1103515245 + 12345) & 0xFFFFFFFF',
+                    f'v[{x}] = (r >> 16) & {nn}']
+        if op == 0xF:
+            return self._block_source_f(x, nn)
+        return None
+    
+    def _block_source_8(self, x: int, y: int, n: int) -> Optional[List[str]]:
+        """Block statements for 8XYN"""
+        if n == 0x0:
+            return [f'v[{x}] = v[{y}]']
+        if n in (0x1, 0x2, 0x3):
+            lines = [f'v[{x}] {"|&^"[n - 1]}= v[{y}]']
+            if self._quirk_vf_reset:
+                lines.append('v[15] = 0')
+            return lines
+        if n == 0x4:
+            return [f'r = v[{x}] + v[{y}]',
+                    f'v[{x}] = r & 0xFF',
+                    'v[15] = r >> 8']
+        if n == 0x5:
+            return [f'r = 0 if v[{x}] < v[{y}] else 1',
+                    f'v[{x}] = (v[{x}] - v[{y}]) & 0xFF',
+                    'v[15] = r']
+        if n == 0x7:
+            return [f'r = 0 if v[{y}] < v[{x}] else 1',
+                    f'v[{x}] = (v[{y}] - v[{x}]) & 0xFF',
+                    'v[15] = r']
+        
+        # Shift source register follows the shifting quirk
+        src = x if self.config.quirk_shifting else y
+        if n == 0x6:
+            return [f'r = v[{src}]',
+                    f'v[{x}] = r >> 1',
+                    'v[15] = r & 0x01']
+        if n == 0xE:
+            return [f'r = v[{src}]',
+                    f'v[{x}] = (r << 1) & 0xFF',
+                    'v[15] = (r >> 7) & 0x01']
+        return None
+    
+    def _block_source_f(self, x: int, nn: int) -> Optional[List[str]]:
+        """Block statements for the FXNN opcodes that only touch registers"""
+        if nn == 0x07:
+            return [f'v[{x}] = cpu.delay_timer']
+        if nn == 0x15:
+            return [f'cpu.delay_timer = v[{x}]']
+        if nn == 0x18:
+            return [f'cpu.sound_timer = v[{x}]']
+        if nn == 0x1E:
+            return [f'cpu.i = (cpu.i + v[{x}]) & 0xFFFF']
+        if nn == 0x29:
+            return [f'cpu.i = {self._font_start} + (v[{x}] & 0x0F) * 5']
+        if nn == 0x30:
+            return [f'r = v[{x}] & 0x0F',
+                    f'if r <= 9: cpu.i = {self._hires_font_start} + r * 10']
+        return None
+    
+    def _execute(self, opcode: int):
+        """Decode and execute a single opcode"""
+        handler, args = self._decode(opcode)
+        handler(*args)
+    
+    def _build_dispatch(self):
+        """
+        Build opcode jump tables (first nibble, 00NN, 8XYN, FXNN).
         
-        # ==================== 0xB___ ====================
-        elif op == 0xB:
-            # BNNN: JP V0, addr - Jump to NNN + V0
-            # Quirk: CHIP-48 uses Vx instead of V0 (BXNN)
-            if self.config.quirk_jumping:
-                self.pc = nnn + self.v[x]
-            else:
-                self.pc = nnn + self.v[0]
-        
-        # ==================== 0xC___ ====================
-        elif op == 0xC:
-            # CXNN: RND Vx, byte - Set Vx = random & NN
-            self.v[x] = random.randint(0, 255) & nn
-            self.pc += 2
+        Quirk settings are fixed once the CPU is configured, so the
+        matching handler variant is bound here instead of being
+        checked on every instruction.
+        """
+        cfg = self.config
         
-        # ==================== 0xD___ ====================
-        elif op == 0xD:
-            # DXYN: DRW Vx, Vy, nibble - Draw sprite
-            self._draw(x, y, n)
-            self.pc += 2
+        if cfg.quirk_shifting:
+            shr, shl = self._8xy6_chip48, self._8xye_chip48
+        else:
+            shr, shl = self._8xy6_vip, self._8xye_vip
         
-        # ==================== 0xE___ ====================
-        elif op == 0xE:
-            if nn == 0x9E:
-                # EX9E: SKP Vx - Skip if key Vx is pressed
-                key = self.v[x] & 0x0F
-                self.pc += 4 if self.keys[key] else 2
-            elif nn == 0xA1:
-                # EXA1: SKNP Vx - Skip if key Vx is NOT pressed
-                key = self.v[x] & 0x0F
-                self.pc += 4 if not self.keys[key] else 2
-            else:
-                self.pc += 2  # Unknown
-        
-        # ==================== 0xF___ ====================
-        elif op == 0xF:
-            self._execute_fxxx(x, nn)
+        if cfg.quirk_jumping:
+            jump = self._opB_chip48
+        else:
+            jump = self._opB_vip
         
+        if cfg.quirk_memory_increment:
+            store, load = self._fx55_vip, self._fx65_vip
         else:
-            # Unknown opcode - skip
-            self.pc += 2
+            store, load = self._fx55_chip48, self._fx65_chip48
+        
+        self._dispatch = [
+            self._op0, self._op1, self._op2, self._op3,
+            self._op4, self._op5, self._op6, self._op7,
+            self._op8, self._op9, self._opA, jump,
+            self._opC, self._opD, self._opE, self._opF,
+        ]
+        
+        # 00NN control opcodes keyed by full opcode (00CN/00DN take N)
+        self._dispatch_0 = {
+            0x00E0: self._cls,
+            0x00EE: self._ret,
+            0x00FB: self._scroll_right,
+            0x00FC: self._scroll_left,
+            0x00FD: self._exit,
+            0x00FE: self._set_lores,
+            0x00FF: self._set_hires,
+        }
+        
+        # 8XYN indexed by N; unassigned slots are NOPs
+        self._dispatch_8 = [self._8xy_nop] * 16
+        self._dispatch_8[0x0] = self._8xy0
+        self._dispatch_8[0x1] = self._8xy1
+        self._dispatch_8[0x2] = self._8xy2
+        self._dispatch_8[0x3] = self._8xy3
+        self._dispatch_8[0x4] = self._8xy4
+        self._dispatch_8[0x5] = self._8xy5
+        self._dispatch_8[0x6] = shr
+        self._dispatch_8[0x7] = self._8xy7
+        self._dispatch_8[0xE] = shl
+        
+        # FXNN keyed by NN
+        self._dispatch_f = {
+            0x07: self._fx07,
+            0x0A: self._fx0a,
+            0x15: self._fx15,
+            0x18: self._fx18,
+            0x1E: self._fx1e,
+            0x29: self._fx29,
+            0x30: self._fx30,
+            0x33: self._fx33,
+            0x55: store,
+            0x65: load,
+            0x75: self._fx75,
+            0x85: self._fx85,
+        }
+    
+    # ==================== 0x0___ ====================
+    
+    def _op0(self, opcode: int, nnn: int, nn: int, n: int, x: int, y: int):
+        """0NNN: SYS addr, 0000 and unknown 00NN - NOP"""
+        # 00E0/00EE/00FB-00FF and 00CN/00DN are resolved to their handlers
+        # by _decode; only opcodes without one land here.
+        # Original COSMAC VIP: 0NNN calls 1802 machine code at NNN
+        # Modern interpreters: NOP or ignored
+        self.pc += 2
     
-    def _execute_8xxx(self, x: int, y: int, n: int):
-        """Execute 8XYN arithmetic/logic opcodes"""
-        
+    # ==================== 0x1___ - 0x7___ ====================
+    
+    def _op1(self, opcode: int, nnn: int, nn: int, n: int, x: int, y: int):
+        """1NNN: JP addr - Jump to address NNN"""
+        self.pc = nnn
+    
+    def _op2(self, opcode: int, nnn: int, nn: int, n: int, x: int, y: int):
+        """2NNN: CALL addr - Call subroutine at NNN"""
+        if self.sp >= self._stack_size:
+            self.halted = True  # Stack overflow
+            return
+        self.stack[self.sp] = self.pc
+        self.sp += 1
+        self.pc = nnn
+    
+    def _op3(self, opcode: int, nnn: int, nn: int, n: int, x: int, y: int):
+        """3XNN: SE Vx, byte - Skip if Vx == NN"""
+        self.pc += 2 + ((self.v[x] == nn) << 1)
+    
+    def _op4(self, opcode: int, nnn: int, nn: int, n: int, x: int, y: int):
+        """4XNN: SNE Vx, byte - Skip if Vx != NN"""
+        self.pc += 2 + ((self.v[x] != nn) << 1)
+    
+    def _op5(self, opcode: int, nnn: int, nn: int, n: int, x: int, y: int):
+        """5XYN family: register compare and XO-CHIP range save/load"""
         if n == 0x0:
-            # 8XY0: LD Vx, Vy - Set Vx = Vy
-            self.v[x] = self.v[y]
-        
-        elif n == 0x1:
-            # 8XY1: OR Vx, Vy - Set Vx = Vx OR Vy
-            self.v[x] |= self.v[y]
-            if self.config.quirk_vf_reset:
-                self.v[0xF] = 0
-        
+            # 5XY0: SE Vx, Vy - Skip if Vx == Vy
+            self.pc += 2 + ((self.v[x] == self.v[y]) << 1)
         elif n == 0x2:
-            # 8XY2: AND Vx, Vy - Set Vx = Vx AND Vy
-            self.v[x] &= self.v[y]
-            if self.config.quirk_vf_reset:
-                self.v[0xF] = 0
-        
+            # 5XY2: SAVE Vx - Vy (XO-CHIP) - Store Vx-Vy to memory[I]
+            self._save_range(x, y)
         elif n == 0x3:
-            # 8XY3: XOR Vx, Vy - Set Vx = Vx XOR Vy
-            self.v[x] ^= self.v[y]
-            if self.config.quirk_vf_reset:
-                self.v[0xF] = 0
-        
-        elif n == 0x4:
-            # 8XY4: ADD Vx, Vy - Set Vx = Vx + Vy, VF = carry
-            result = self.v[x] + self.v[y]
-            self.v[x] = result & 0xFF
-            self.v[0xF] = 1 if result > 0xFF else 0
-        
-        elif n == 0x5:
-            # 8XY5: SUB Vx, Vy - Set Vx = Vx - Vy, VF = NOT borrow
-            borrow = 0 if self.v[x] < self.v[y] else 1
-            self.v[x] = (self.v[x] - self.v[y]) & 0xFF
-            self.v[0xF] = borrow
-        
-        elif n == 0x6:
-            # 8XY6: SHR Vx {, Vy} - Set Vx = Vy >> 1, VF = LSB
-            # Quirk: CHIP-48/SCHIP shift Vx, original VIP shifts Vy into Vx
-            if self.config.quirk_shifting:
-                src = self.v[x]
-            else:
-                src = self.v[y]
-            lsb = src & 0x01
-            self.v[x] = src >> 1
-            self.v[0xF] = lsb
-        
-        elif n == 0x7:
-            # 8XY7: SUBN Vx, Vy - Set Vx = Vy - Vx, VF = NOT borrow
-            borrow = 0 if self.v[y] < self.v[x] else 1
-            self.v[x] = (self.v[y] - self.v[x]) & 0xFF
-            self.v[0xF] = borrow
-        
-        elif n == 0xE:
-            # 8XYE: SHL Vx {, Vy} - Set Vx = Vy << 1, VF = MSB
-            # Quirk: Same as 8XY6
-            if self.config.quirk_shifting:
-                src = self.v[x]
-            else:
-                src = self.v[y]
-            msb = (src >> 7) & 0x01
-            self.v[x] = (src << 1) & 0xFF
-            self.v[0xF] = msb
-        
+            # 5XY3: LOAD Vx - Vy (XO-CHIP) - Load Vx-Vy from memory[I]
+            self._load_range(x, y)
+        else:
+            self.pc += 2  # Unknown, skip
+    
+    def _op6(self, opcode: int, nnn: int, nn: int, n: int, x: int, y: int):
+        """6XNN: LD Vx, byte - Set Vx = NN"""
+        self.v[x] = nn
         self.pc += 2
     
-    def _execute_fxxx(self, x: int, nn: int):
-        """Execute FXNN opcodes"""
-        
-        if nn == 0x07:
-            # FX07: LD Vx, DT - Set Vx = delay timer
-            self.v[x] = self.delay_timer
-        
-        elif nn == 0x0A:
-            # FX0A: LD Vx, K - Wait for key press, store in Vx
-            # Blocks execution until a key is pressed
-            self.waiting_for_key = True
-            self.key_register = x
-            return  # Don't advance PC until key pressed
-        
-        elif nn == 0x15:
-            # FX15: LD DT, Vx - Set delay timer = Vx
-            self.delay_timer = self.v[x]
-        
-        elif nn == 0x18:
-            # FX18: LD ST, Vx - Set sound timer = Vx
-            self.sound_timer = self.v[x]
-        
-        elif nn == 0x1E:
-            # FX1E: ADD I, Vx - Set I = I + Vx
-            # Note: VF set to 1 if I > 0xFFF (Amiga quirk, not standard)
-            self.i = (self.i + self.v[x]) & 0xFFFF
-        
-        elif nn == 0x29:
-            # FX29: LD F, Vx - Set I = location of sprite for digit Vx
-            # Points to 4x5 font character
-            digit = self.v[x] & 0x0F
-            self.i = self.config.font_start + (digit * 5)
-        
-        elif nn == 0x30:
-            # FX30: LD HF, Vx - Set I = location of 8x10 font (SUPER-CHIP)
-            digit = self.v[x] & 0x0F
-            if digit <= 9:
-                self.i = self.config.hires_font_start + (digit * 10)
-        
-        elif nn == 0x33:
-            # FX33: LD B, Vx - Store BCD of Vx at I, I+1, I+2
-            value = self.v[x]
-            self.memory[self.i] = value // 100
-            self.memory[self.i + 1] = (value // 10) % 10
-            self.memory[self.i + 2] = value % 10
-        
-        elif nn == 0x55:
-            # FX55: LD [I], Vx - Store V0 through Vx at I
-            for idx in range(x + 1):
-                self.memory[self.i + idx] = self.v[idx]
-            # Quirk: Original VIP increments I, CHIP-48 doesn't
-            if self.config.quirk_memory_increment:
-                self.i = (self.i + x + 1) & 0xFFFF
-        
-        elif nn == 0x65:
-            # FX65: LD Vx, [I] - Load V0 through Vx from I
-            for idx in range(x + 1):
-                self.v[idx] = self.memory[self.i + idx]
-            # Quirk: Same as FX55
-            if self.config.quirk_memory_increment:
-                self.i = (self.i + x + 1) & 0xFFFF
-        
-        elif nn == 0x75:
-            # FX75: LD R, Vx - Store V0-Vx in RPL flags (SUPER-CHIP)
-            # x <= 7
-            for idx in range(min(x + 1, 8)):
-                self.rpl_flags[idx] = self.v[idx]
-        
-        elif nn == 0x85:
-            # FX85: LD Vx, R - Load V0-Vx from RPL flags (SUPER-CHIP)
-            for idx in range(min(x + 1, 8)):
-                self.v[idx] = self.rpl_flags[idx]
-        
+    def _op7(self, opcode: int, nnn: int, nn: int, n: int, x: int, y: int):
+        """7XNN: ADD Vx, byte - Set Vx = Vx + NN (no carry flag)"""
+        self.v[x] = (self.v[x] + nn) & 0xFF
+        self.pc += 2
+    
+    # ==================== 0x8___ ====================
+    
+    def _op8(self, opcode: int, nnn: int, nn: int, n: int, x: int, y: int):
+        """8XYN: Arithmetic/logic opcodes, dispatched on N"""
+        self._dispatch_8[n](x, y)
+        self.pc += 2
+    
+    def _8xy0(self, x: int, y: int):
+        """8XY0: LD Vx, Vy - Set Vx = Vy"""
+        self.v[x] = self.v[y]
+    
+    def _8xy1(self, x: int, y: int):
+        """8XY1: OR Vx, Vy - Set Vx = Vx OR Vy"""
+        self.v[x] |= self.v[y]
+        if self._quirk_vf_reset:
+            self.v[0xF] = 0
+    
+    def _8xy2(self, x: int, y: int):
+        """8XY2: AND Vx, Vy - Set Vx = Vx AND Vy"""
+        self.v[x] &= self.v[y]
+        if self._quirk_vf_reset:
+            self.v[0xF] = 0
+    
+    def _8xy3(self, x: int, y: int):
+        """8XY3: XOR Vx, Vy - Set Vx = Vx XOR Vy"""
+        self.v[x] ^= self.v[y]
+        if self._quirk_vf_reset:
+            self.v[0xF] = 0
+    
+    def _8xy4(self, x: int, y: int):
+        """8XY4: ADD Vx, Vy - Set Vx = Vx + Vy, VF = carry"""
+        result = self.v[x] + self.v[y]
+        self.v[x] = result & 0xFF
+        self.v[0xF] = 1 if result > 0xFF else 0
+    
+    def _8xy5(self, x: int, y: int):
+        """8XY5: SUB Vx, Vy - Set Vx = Vx - Vy, VF = NOT borrow"""
+        borrow = 0 if self.v[x] < self.v[y] else 1
+        self.v[x] = (self.v[x] - self.v[y]) & 0xFF
+        self.v[0xF] = borrow
+    
+    def _8xy6_vip(self, x: int, y: int):
+        """8XY6: SHR Vx {, Vy} - Set Vx = Vy >> 1, VF = LSB"""
+        # Quirk: original VIP shifts Vy into Vx
+        src = self.v[y]
+        self.v[x] = src >> 1
+        self.v[0xF] = src & 0x01
+    
+    def _8xy6_chip48(self, x: int, y: int):
+        """8XY6: SHR Vx - Set Vx = Vx >> 1, VF = LSB"""
+        # Quirk: CHIP-48/SCHIP shift Vx in place
+        src = self.v[x]
+        self.v[x] = src >> 1
+        self.v[0xF] = src & 0x01
+    
+    def _8xy7(self, x: int, y: int):
+        """8XY7: SUBN Vx, Vy - Set Vx = Vy - Vx, VF = NOT borrow"""
+        borrow = 0 if self.v[y] < self.v[x] else 1
+        self.v[x] = (self.v[y] - self.v[x]) & 0xFF
+        self.v[0xF] = borrow
+    
+    def _8xye_vip(self, x: int, y: int):
+        """8XYE: SHL Vx {, Vy} - Set Vx = Vy << 1, VF = MSB"""
+        # Quirk: Same as 8XY6
+        src = self.v[y]
+        self.v[x] = (src << 1) & 0xFF
+        self.v[0xF] = (src >> 7) & 0x01
+    
+    def _8xye_chip48(self, x: int, y: int):
+        """8XYE: SHL Vx - Set Vx = Vx << 1, VF = MSB"""
+        src = self.v[x]
+        self.v[x] = (src << 1) & 0xFF
+        self.v[0xF] = (src >> 7) & 0x01
+    
+    def _8xy_nop(self, x: int, y: int):
+        """8XYN with undefined N - no operation"""
+        pass
+    
+    # ==================== 0x9___ - 0xE___ ====================
+    
+    def _op9(self, opcode: int, nnn: int, nn: int, n: int, x: int, y: int):
+        """9XY0: SNE Vx, Vy - Skip if Vx != Vy"""
+        if n == 0x0:
+            self.pc += 2 + ((self.v[x] != self.v[y]) << 1)
+        else:
+            self.pc += 2  # Unknown
+    
+    def _opA(self, opcode: int, nnn: int, nn: int, n: int, x: int, y: int):
+        """ANNN: LD I, addr - Set I = NNN"""
+        self.i = nnn
+        self.pc += 2
+    
+    def _opB_vip(self, opcode: int, nnn: int, nn: int, n: int, x: int, y: int):
+        """BNNN: JP V0, addr - Jump to NNN + V0"""
+        self.pc = nnn + self.v[0]
+    
+    def _opB_chip48(self, opcode: int, nnn: int, nn: int, n: int, x: int, y: int):
+        """BXNN: JP Vx, addr - Jump to XNN + Vx"""
+        # Quirk: CHIP-48 uses Vx instead of V0
+        self.pc = nnn + self.v[x]
+    
+    def _opC(self, opcode: int, nnn: int, nn: int, n: int, x: int, y: int):
+        """CXNN: RND Vx, byte - Set Vx = random & NN"""
+        self._rng = (self._rng * 1103515245 + 12345) & 0xFFFFFFFF
+        self.v[x] = (self._rng >> 16) & nn
         self.pc += 2
     
+    def _opD(self, opcode: int, nnn: int, nn: int, n: int, x: int, y: int):
+        """DXYN: DRW Vx, Vy, nibble - Draw sprite"""
+        self._draw(x, y, n)
+        self.pc += 2
+    
+    def _opE(self, opcode: int, nnn: int, nn: int, n: int, x: int, y: int):
+        """EXNN family: keypad skips"""
+        if nn == 0x9E:
+            # EX9E: SKP Vx - Skip if key Vx is pressed
+            key = self.v[x] & 0x0F
+            self.pc += 2 + (self.keys[key] << 1)
+        elif nn == 0xA1:
+            # EXA1: SKNP Vx - Skip if key Vx is NOT pressed
+            key = self.v[x] & 0x0F
+            self.pc += 2 + ((not self.keys[key]) << 1)
+        else:
+            self.pc += 2  # Unknown
+    
+    # ==================== 0xF___ ====================
+    
+    def _opF(self, opcode: int, nnn: int, nn: int, n: int, x: int, y: int):
+        """FXNN: Timer, memory and font opcodes, dispatched on NN"""
+        handler = self._dispatch_f.get(nn)
+        if handler is not None:
+            handler(x)
+        
+        # FX0A blocks: don't advance PC until key pressed
+        if not self._status & STATUS_WAITING:
+            self.pc += 2
+    
+    def _fx07(self, x: int):
+        """FX07: LD Vx, DT - Set Vx = delay timer"""
+        self.v[x] = self.delay_timer
+    
+    def _fx0a(self, x: int):
+        """FX0A: LD Vx, K - Wait for key press, store in Vx"""
+        # Blocks execution until a key is pressed
+        self.waiting_for_key = True
+        self.key_register = x
+    
+    def _fx15(self, x: int):
+        """FX15: LD DT, Vx - Set delay timer = Vx"""
+        self.delay_timer = self.v[x]
+    
+    def _fx18(self, x: int):
+        """FX18: LD ST, Vx - Set sound timer = Vx"""
+        self.sound_timer = self.v[x]
+    
+    def _fx1e(self, x: int):
+        """FX1E: ADD I, Vx - Set I = I + Vx"""
+        # Note: VF set to 1 if I > 0xFFF (Amiga quirk, not standard)
+        self.i = (self.i + self.v[x]) & 0xFFFF
+    
+    def _fx29(self, x: int):
+        """FX29: LD F, Vx - Set I = location of sprite for digit Vx"""
+        # Points to 4x5 font character
+        digit = self.v[x] & 0x0F
+        self.i = self._font_start + (digit * 5)
+    
+    def _fx30(self, x: int):
+        """FX30: LD HF, Vx - Set I = location of 8x10 font (SUPER-CHIP)"""
+        digit = self.v[x] & 0x0F
+        if digit <= 9:
+            self.i = self._hires_font_start + (digit * 10)
+    
+    def _fx33(self, x: int):
+        """FX33: LD B, Vx - Store BCD of Vx at I, I+1, I+2"""
+        hundreds, rest = divmod(self.v[x], 100)
+        tens, ones = divmod(rest, 10)
+        self._check_span(self.i, 3)
+        self.memory[self.i:self.i + 3] = bytes((hundreds, tens, ones))
+        self._invalidate(self.i, 3)
+    
+    def _fx55_chip48(self, x: int):
+        """FX55: LD [I], Vx - Store V0 through Vx at I"""
+        self._check_span(self.i, x + 1)
+        self.memory[self.i:self.i + x + 1] = self.v[:x + 1]
+        self._invalidate(self.i, x + 1)
+    
+    def _fx55_vip(self, x: int):
+        """FX55: LD [I], Vx - Store V0 through Vx at I, then I += X + 1"""
+        self._check_span(self.i, x + 1)
+        self.memory[self.i:self.i + x + 1] = self.v[:x + 1]
+        self._invalidate(self.i, x + 1)
+        # Quirk: Original VIP increments I, CHIP-48 doesn't
+        self.i = (self.i + x + 1) & 0xFFFF
+    
+    def _fx65_chip48(self, x: int):
+        """FX65: LD Vx, [I] - Load V0 through Vx from I"""
+        self._check_span(self.i, x + 1)
+        self.v[:x + 1] = self.memory[self.i:self.i + x + 1]
+    
+    def _fx65_vip(self, x: int):
+        """FX65: LD Vx, [I] - Load V0 through Vx from I, then I += X + 1"""
+        self._check_span(self.i, x + 1)
+        self.v[:x + 1] = self.memory[self.i:self.i + x + 1]
+        # Quirk: Same as FX55
+        self.i = (self.i + x + 1) & 0xFFFF
+    
+    def _fx75(self, x: int):
+        """FX75: LD R, Vx - Store V0-Vx in RPL flags (SUPER-CHIP)"""
+        # x <= 7
+        for idx in range(min(x + 1, 8)):
+            self.rpl_flags[idx] = self.v[idx]
+    
+    def _fx85(self, x: int):
+        """FX85: LD Vx, R - Load V0-Vx from RPL flags (SUPER-CHIP)"""
+        for idx in range(min(x + 1, 8)):
+            self.v[idx] = self.rpl_flags[idx]
+    
+    
     # ==================== DISPLAY OPERATIONS ====================
     
     def _cls(self):
         """00E0: Clear display"""
-        for row in self.display:
-            for i in range(len(row)):
-                row[i] = 0
+        self.display[:] = self._blank
+        self.dirty_rows = self.all_rows
         self.draw_flag = True
         self.pc += 2
     
@@ -617,52 +1128,28 @@ class Chip8CPU:
         if n == 0 and self.hires_mode:
             # SUPER-CHIP: 16x16 sprite
             self._draw_16x16(vx, vy)
+            n = 16
         else:
             # Standard 8xN sprite
             self._draw_8xn(vx, vy, n)
         
+        # Mark touched rows, folding wrapped rows back to the top
+        rows = ((1 << n) - 1) << vy
+        self.dirty_rows |= rows | (rows >> self.display_height)
         self.draw_flag = True
     
     def _draw_8xn(self, vx: int, vy: int, n: int):
         """Draw standard 8-pixel wide sprite"""
-        for row in range(n):
-            py = vy + row
-            
-            # Clipping quirk
-            if self.config.quirk_clipping and py >= self.display_height:
-                break
-            py = py % self.display_height
-            
-            sprite_byte = self.memory[self.i + row]
-            
-            for col in range(8):
-                px = vx + col
-                
-                if self.config.quirk_clipping and px >= self.display_width:
-                    break
-                px = px % self.display_width
-                
-                if sprite_byte & (0x80 >> col):
-                    if self.display[py][px] == 1:
-                        self.v[0xF] = 1  # Collision
-                    self.display[py][px] ^= 1
+        if blit_8xn(self.display, self.memory, self.i, vx, vy, n,
+                    self.display_width, self.display_height, self.stride,
+                    self._quirk_clipping):
+            self.v[0xF] = 1  # Collision
     
     def _draw_16x16(self, vx: int, vy: int):
         """Draw SUPER-CHIP 16x16 sprite"""
-        for row in range(16):
-            py = (vy + row) % self.display_height
-            
-            # 2 bytes per row
-            sprite_word = (self.memory[self.i + row * 2] << 8) | \
-                         self.memory[self.i + row * 2 + 1]
-            
-            for col in range(16):
-                px = (vx + col) % self.display_width
-                
-                if sprite_word & (0x8000 >> col):
-                    if self.display[py][px] == 1:
-                        self.v[0xF] = 1
-                    self.display[py][px] ^= 1
+        if blit_16x16(self.display, self.memory, self.i, vx, vy,
+                      self.display_width, self.display_height, self.stride):
+            self.v[0xF] = 1
     
     # ==================== SUPER-CHIP SCROLLING ====================
     
@@ -672,14 +1159,14 @@ class Chip8CPU:
             self.pc += 2
             return
         
-        # Move rows down
-        for y in range(self.display_height - 1, n - 1, -1):
-            self.display[y] = self.display[y - n][:]
+        end = self.display_height * self.stride
+        shift = n * self.stride
         
-        # Clear top rows
-        for y in range(n):
-            self.display[y] = [0] * len(self.display[y])
+        # Move rows down, then clear top rows
+        self.display[shift:end] = self.display[:end - shift]
+        self.display[:shift] = self._blank[:shift]
         
+        self.dirty_rows = self.all_rows
         self.draw_flag = True
         self.pc += 2
     
@@ -689,42 +1176,61 @@ class Chip8CPU:
             self.pc += 2
             return
         
-        for y in range(self.display_height - n):
-            self.display[y] = self.display[y + n][:]
+        end = self.display_height * self.stride
+        shift = n * self.stride
         
-        for y in range(self.display_height - n, self.display_height):
-            self.display[y] = [0] * len(self.display[y])
+        self.display[:end - shift] = self.display[shift:end]
+        self.display[end - shift:end] = self._blank[:shift]
         
+        self.dirty_rows = self.all_rows
         self.draw_flag = True
         self.pc += 2
     
     def _scroll_right(self):
         """00FB: Scroll display right 4 pixels"""
-        for y in range(self.display_height):
-            row = self.display[y]
-            # Shift right by 4
-            self.display[y] = [0, 0, 0, 0] + row[:-4]
-        
+        stride = self.stride
+        height = self.display_height
+        end = height * stride
+        
+        # Shift the whole frame, then blank the 4 columns that wrapped
+        # in from the end of the previous row
+        self.display[4:end] = self.display[:end - 4]
+        zeros = self._blank[:height]
+        for col in range(4):
+            self.display[col:end:stride] = zeros
+        
+        self.dirty_rows = self.all_rows
         self.draw_flag = True
         self.pc += 2
     
     def _scroll_left(self):
         """00FC: Scroll display left 4 pixels"""
-        for y in range(self.display_height):
-            row = self.display[y]
-            # Shift left by 4
-            self.display[y] = row[4:] + [0, 0, 0, 0]
+        stride = self.stride
+        height = self.display_height
+        end = height * stride
+        
+        self.display[:end - 4] = self.display[4:end]
+        zeros = self._blank[:height]
+        for col in range(stride - 4, stride):
+            self.display[col:end:stride] = zeros
         
+        self.dirty_rows = self.all_rows
         self.draw_flag = True
         self.pc += 2
     
     # ==================== DISPLAY MODE ====================
     
+    def _exit(self):
+        """00FD: Exit interpreter (SUPER-CHIP)"""
+        self.halted = True
+    
     def _set_lores(self):
         """00FE: Set low resolution mode (64x32)"""
         self.hires_mode = False
         self.display_width = self.config.lores_width
         self.display_height = self.config.lores_height
+        self.dirty_rows = self.all_rows
+        self.hires_changed = True
         self.pc += 2
     
     def _set_hires(self):
@@ -732,6 +1238,8 @@ class Chip8CPU:
         self.hires_mode = True
         self.display_width = self.config.hires_width
         self.display_height = self.config.hires_height
+        self.dirty_rows = self.all_rows
+        self.hires_changed = True
         self.pc += 2
     
     # ==================== STACK OPERATIONS ====================
@@ -755,6 +1263,7 @@ class Chip8CPU:
         else:
             for idx, reg in enumerate(range(x, y - 1, -1)):
                 self.memory[self.i + idx] = self.v[reg]
+        self._invalidate(self.i, abs(x - y) + 1)
         self.pc += 2
     
     def _load_range(self, x: int, y: int):
@@ -798,33 +1307,57 @@ class Chip8CPU:
         """Get complete emulator state for saving"""
         return EmulatorState(
             memory=bytes(self.memory),
-            v=list(self.v),
+            v=bytes(self.v),
             i=self.i,
             pc=self.pc,
             stack=list(self.stack),
             sp=self.sp,
             delay_timer=self.delay_timer,
             sound_timer=self.sound_timer,
-            display=[row[:] for row in self.display],
-            keys=list(self.keys),
+            display=bytes(self.display),
+            keys=[bool(k) for k in self.keys],
             hires_mode=self.hires_mode,
             rpl_flags=list(self.rpl_flags),
+            rng_state=self._rng,
         )
     
+    def get_state_bytes(self) -> bytes:
+        """Get the emulator state as save file contents"""
+        # Memory and framebuffer are mostly zeros: compress, but cheaply
+        data = pickle.dumps(self.get_state(), protocol=pickle.HIGHEST_PROTOCOL)
+        return gzip.compress(data, compresslevel=1)
+    
+    def load_state_bytes(self, data: bytes):
+        """Restore emulator state from save file contents"""
+        if data[:2] == b'\x1f\x8b':
+            data = gzip.decompress(data)
+        # Saves from before compression are plain pickles
+        self.load_state(pickle.loads(data))
+    
     def load_state(self, state: EmulatorState):
         """Restore emulator state from save"""
         self.memory = bytearray(state.memory)
-        self.v = list(state.v)
+        self._decoded.clear()
+        self.v = bytearray(state.v)
         self.i = state.i
         self.pc = state.pc
-        self.stack = list(state.stack)
+        self.stack = array.array('H', state.stack)
         self.sp = state.sp
         self.delay_timer = state.delay_timer
         self.sound_timer = state.sound_timer
-        self.display = [row[:] for row in state.display]
-        self.keys = list(state.keys)
+        display = state.display
+        if display and isinstance(display[0], list):
+            # Saves from before the flat framebuffer hold one list per row
+            stride = self.stride
+            flat = bytearray(len(self.display))
+            for y, row in enumerate(display):
+                flat[y * stride:y * stride + len(row)] = bytes(row)
+            display = flat
+        self.display = bytearray(display)
+        self.keys = bytearray(state.keys)
         self.hires_mode = state.hires_mode
         self.rpl_flags = list(state.rpl_flags)
+        self._rng = state.rng_state
         
         # Update display dimensions
         if self.hires_mode:
@@ -834,9 +1367,10 @@ class Chip8CPU:
             self.display_width = self.config.lores_width
             self.display_height = self.config.lores_height
         
+        self.dirty_rows = self.all_rows
+        self.hires_changed = True
         self.draw_flag = True
-        self.halted = False
-        self.waiting_for_key = False
+        self._status = 0
 
 
 # ============================================================================
@@ -884,33 +1418,58 @@ class Chip8Display:
         self.canvas_width = int(canvas['width'])
         self.canvas_height = int(canvas['height'])
         
-        # Pre-create pixel rectangles
-        self.pixel_rects = {}
+        # Raw Tcl entry point: skips tkinter's option-parsing wrappers
+        self.tcl_call = canvas.tk.call
+        
+        # Pixel colors live on the Tcl side; rows cross over as '0'/'1'
+        self.tcl_call('set', 'chip8_pixel_map', (
+            '0', COLORS['pixel_off'] + ' ',
+            '1', COLORS['pixel_on'] + ' ',
+        ))
+        canvas.tk.eval(PUT_ROWS_PROC)
+        
+        # Native-resolution frame and its zoomed copy shown on the canvas
+        self.frame_image: Optional[tk.PhotoImage] = None
+        self.scaled_image: Optional[tk.PhotoImage] = None
+        self.frame_name = ""
+        self.scaled_name = ""
+        self.scale_x = 1
+        self.scale_y = 1
+        self.scaled_width = self.canvas_width
+        self.scaled_height = self.canvas_height
+        self.offset_x = 0
+        self.offset_y = 0
+        self.shown_rows: List[Optional[bytes]] = []  # Row pixels last pushed
         self.scanline_rects = []
         
         self._create_pixels()
     
     def _create_pixels(self):
-        """Create pixel grid for current resolution"""
+        """Create frame images for current resolution"""
         self.canvas.delete("all")
-        self.pixel_rects.clear()
+        self.scanline_rects.clear()
         
-        scale_x = self.canvas_width / self.width
-        scale_y = self.canvas_height / self.height
+        # Integer zoom keeps pixels square-edged; center any leftover
+        self.scale_x = max(1, self.canvas_width // self.width)
+        self.scale_y = max(1, self.canvas_height // self.height)
+        self.scaled_width = self.width * self.scale_x
+        self.scaled_height = self.height * self.scale_y
+        self.offset_x = (self.canvas_width - self.scaled_width) // 2
+        self.offset_y = (self.canvas_height - self.scaled_height) // 2
+        
+        self.frame_image = tk.PhotoImage(width=self.width, height=self.height)
+        self.shown_rows: List[Optional[bytes]] = [None] * self.height
+        self.scaled_image = tk.PhotoImage(width=self.scaled_width,
+                                          height=self.scaled_height)
+        self.canvas.create_image(
+            self.offset_x, self.offset_y,
+            image=self.scaled_image,
+            anchor=tk.NW
+        )
         
-        for y in range(self.height):
-            for x in range(self.width):
-                x1 = x * scale_x
-                y1 = y * scale_y
-                x2 = x1 + scale_x
-                y2 = y1 + scale_y
-                
-                rect = self.canvas.create_rectangle(
-                    x1, y1, x2, y2,
-                    fill=COLORS['pixel_off'],
-                    outline=""
-                )
-                self.pixel_rects[(x, y)] = rect
+        # Tcl image commands for the per-frame calls in render()
+        self.frame_name = self.frame_image.name
+        self.scaled_name = self.scaled_image.name
         
         self._create_scanlines()
     
@@ -921,11 +1480,14 @@ class Chip8Display:
         self.scanline_rects.clear()
         
         if self.scanlines_enabled:
-            scale_y = self.canvas_height / self.height
-            for y in range(0, self.canvas_height, int(scale_y * 2)):
+            # Darken every odd pixel row on the same integer grid as the image
+            left = self.offset_x
+            right = left + self.scaled_width
+            for row in range(1, self.height, 2):
+                top = self.offset_y + row * self.scale_y
                 rect = self.canvas.create_rectangle(
-                    0, y + scale_y,
-                    self.canvas_width, y + scale_y * 2,
+                    left, top,
+                    right, top + self.scale_y,
                     fill="#000000",
                     stipple="gray50",
                     outline=""
@@ -944,22 +1506,73 @@ class Chip8Display:
         self.scanlines_enabled = not self.scanlines_enabled
         self._create_scanlines()
     
-    def render(self, display: List[List[int]], hires: bool = False):
-        """Render CHIP-8 display buffer to canvas"""
-        # Update resolution if needed
-        if hires:
-            self.set_resolution(self.config.hires_width, self.config.hires_height)
-        else:
-            self.set_resolution(self.config.lores_width, self.config.lores_height)
+    def render(self, display: bytearray, dirty_rows: Optional[int] = None):
+        """
+        Render CHIP-8 display buffer to canvas
         
+        dirty_rows is a bitmask of changed rows (bit y = row y);
+        None redraws the whole frame. Resolution changes go through
+        set_resolution() first.
+        """
+        if dirty_rows is None:
+            dirty_rows = (1 << self.height) - 1
+        
+        # Keep only dirty rows that differ from what is on screen
+        # (sprites erased and redrawn within a frame cancel out)
+        stride = self.config.hires_width
+        width = self.width
+        view = memoryview(display)
+        shown = self.shown_rows
+        run_start = None
+        run = []
+        band_top = None
+        band_bottom = 0
         for y in range(self.height):
-            for x in range(self.width):
-                pixel = display[y][x] if y < len(display) and x < len(display[y]) else 0
-                color = COLORS['pixel_on'] if pixel else COLORS['pixel_off']
-                
-                rect = self.pixel_rects.get((x, y))
-                if rect:
-                    self.canvas.itemconfig(rect, fill=color)
+            pixels = None
+            if dirty_rows >> y & 1:
+                base = y * stride
+                pixels = view[base:base + width].tobytes()
+                if pixels == shown[y]:
+                    pixels = None
+                else:
+                    shown[y] = pixels
+            
+            if pixels is not None:
+                if not run:
+                    run_start = y
+                run.append(pixels)
+            elif run:
+                # Push each run of consecutive changed rows as one block
+                self._put_rows(run_start, run)
+                if band_top is None:
+                    band_top = run_start
+                band_bottom = y
+                run = []
+        
+        if run:
+            self._put_rows(run_start, run)
+            if band_top is None:
+                band_top = run_start
+            band_bottom = self.height
+        
+        if band_top is not None:
+            # One zoomed copy spanning every changed run
+            self.tcl_call(
+                self.scaled_name, 'copy', self.frame_name,
+                '-from', 0, band_top, width, band_bottom,
+                '-to', 0, band_top * self.scale_y,
+                '-zoom', self.scale_x, self.scale_y
+            )
+    
+    def _put_rows(self, y1: int, pixel_rows: List[bytes]):
+        """Write rows starting at y1 into the native-resolution frame"""
+        rows = ' '.join(
+            '{' + pixels.translate(PIXEL_CHARS).decode('ascii') + '}'
+            for pixels in pixel_rows
+        )
+        
+        # One put for the whole band
+        self.tcl_call('chip8_put_rows', self.frame_name, y1, rows)
 
 
 # ============================================================================
@@ -989,7 +1602,8 @@ class Chip8GUI:
         self.speed_multiplier = 1
         self.fps = 0
         self.frame_count = 0
-        self.last_fps_time = time.time()
+        self._rom_data = b""
+        self._render_pending = False
         self.show_debug = False
         
         # Debug combo tracking
@@ -1001,11 +1615,10 @@ class Chip8GUI:
         self.display_renderer = Chip8Display(self.canvas, self.config)
         
         # Bind input
+        self._keycode_keys = {}  # Tk keycode -> CHIP-8 key, mapped keys only
         self._bind_keys()
         
-        # Threads
-        self._emu_thread: Optional[threading.Thread] = None
-        self._timer_thread: Optional[threading.Thread] = None
+        # Emulation loops (scheduled on the Tk event loop)
         self._emu_running = False
     
     def _create_ui(self):
@@ -1095,19 +1708,29 @@ class Chip8GUI:
         # Click canvas to load ROM
         self.canvas.bind("<Button-1>", self._on_click)
     
+    def _chip8_key(self, event) -> int:
+        """Map a Tk key event to a CHIP-8 key, or -1 if unmapped"""
+        # Resolve each keycode's keysym once, then index by keycode
+        chip8_key = self._keycode_keys.get(event.keycode)
+        if chip8_key is None:
+            chip8_key = KEYBOARD_MAP.get(event.keysym.lower(), -1)
+            # Only cache hits: a modifier can change the keysym (Shift+1 is
+            # 'exclam'), and a cached miss would lock that key out
+            if chip8_key >= 0:
+                self._keycode_keys[event.keycode] = chip8_key
+        return chip8_key
+    
     def _on_key_down(self, event):
         """Handle key press"""
-        key = event.keysym.lower()
-        if key in KEYBOARD_MAP:
-            chip8_key = KEYBOARD_MAP[key]
+        chip8_key = self._chip8_key(event)
+        if chip8_key >= 0:
             self.cpu.keys[chip8_key] = True
             self.cpu.key_pressed(chip8_key)
     
     def _on_key_up(self, event):
         """Handle key release"""
-        key = event.keysym.lower()
-        if key in KEYBOARD_MAP:
-            chip8_key = KEYBOARD_MAP[key]
+        chip8_key = self._chip8_key(event)
+        if chip8_key >= 0:
             self.cpu.keys[chip8_key] = False
             self.cpu.key_released(chip8_key)
     
@@ -1138,6 +1761,7 @@ class Chip8GUI:
             
             name = os.path.basename(filepath)
             self.cpu.load_rom(data, name)
+            self._rom_data = data
             self.rom_label.config(text=f"ROM: {name} ({len(data)}b)")
             self._start_emulation()
             
@@ -1145,7 +1769,7 @@ class Chip8GUI:
             messagebox.showerror("Error", f"Failed to load ROM:\n{e}")
     
     def _start_emulation(self):
-        """Start emulation threads"""
+        """Start emulation loops"""
         if self._emu_running:
             return
         
@@ -1154,78 +1778,109 @@ class Chip8GUI:
         self.paused = False
         self._update_status()
         
-        # CPU thread
-        self._emu_thread = threading.Thread(target=self._emulation_loop, daemon=True)
-        self._emu_thread.start()
-        
-        # Timer thread (60Hz)
-        self._timer_thread = threading.Thread(target=self._timer_loop, daemon=True)
-        self._timer_thread.start()
-        
-        # Start render loop
-        self._render_loop()
+        # CPU, timers and rendering all run on the Tk thread, so the
+        # display buffer is never touched from two threads at once
+        self._emu_deadline = time.perf_counter()
+        self._timer_ticks = 0.0
+        self._emulation_loop()
+        self._fps_loop()
+        self._request_render()
     
     def _emulation_loop(self):
-        """Main CPU emulation loop"""
+        """Main CPU emulation loop (one frame of cycles per call)"""
+        if not self._emu_running:
+            return
+        
         target_fps = 60
-        cycles_per_frame = (self.config.cpu_frequency * self.speed_multiplier) // target_fps
         
-        while self._emu_running:
-            if not self.paused and not self.cpu.halted:
-                start_time = time.perf_counter()
-                
-                # Execute cycles for this frame
-                cycles = cycles_per_frame * self.speed_multiplier
-                for _ in range(cycles):
-                    if not self.cpu.cycle():
-                        break
-                
-                # Maintain timing
-                elapsed = time.perf_counter() - start_time
-                sleep_time = (1.0 / target_fps) - elapsed
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
-            else:
-                time.sleep(1.0 / target_fps)
-    
-    def _timer_loop(self):
-        """Timer decrement loop (60Hz)"""
-        while self._emu_running:
-            if not self.paused:
+        if not self.paused and not self.cpu.halted:
+            # Execute cycles for this frame
+            cycles = (self.config.cpu_frequency * self.speed_multiplier) // target_fps
+            try:
+                self.cpu.run_batch(cycles)
+            except Exception as e:
+                # Halt rather than let the error end the after() chain
+                print(f"CPU Error: {e}")
+                self.cpu.halted = True
+                self.state_label.config(text=f"⚠ CPU error: {e}")
+        
+        if not self.paused:
+            # Timers tick at the end of the frame (once per frame at 60Hz)
+            self._timer_ticks += self.config.timer_frequency / target_fps
+            while self._timer_ticks >= 1.0:
+                self._timer_ticks -= 1.0
                 self.cpu.update_timers()
-                self.audio.update(self.cpu.sound_timer)
-            time.sleep(1.0 / self.config.timer_frequency)
+            self.audio.update(self.cpu.sound_timer)
+        
+        self.frame_count += 1
+        self._request_render()
+        
+        # Maintain timing
+        self._emu_deadline = self._schedule_at(
+            self._emu_deadline + 1.0 / target_fps, self._emulation_loop)
+    
+    def _schedule_at(self, deadline: float, callback) -> float:
+        """
+        Schedule callback for a perf_counter() deadline; returns the
+        deadline actually used.
+        
+        Deadlines advance by a fixed period, so after()'s millisecond
+        rounding does not accumulate. A missed deadline resyncs to now
+        instead of firing a burst of catch-up calls.
+        """
+        now = time.perf_counter()
+        if deadline < now:
+            deadline = now
+        self.root.after(int((deadline - now) * 1000), callback)
+        return deadline
+    
+    def _request_render(self):
+        """Schedule one idle-time render if the display changed"""
+        if self._render_pending:
+            return
+        if self.cpu.draw_flag or self.cpu.hires_changed:
+            self._render_pending = True
+            self.root.after_idle(self._render_frame)
     
-    def _render_loop(self):
-        """Display update loop"""
+    def _render_frame(self):
+        """Push pending display changes to the renderer"""
+        self._render_pending = False
         if not self._emu_running:
             return
         
-        # Render display
-        if self.cpu.draw_flag:
-            self.display_renderer.render(
-                self.cpu.display,
-                self.cpu.hires_mode
-            )
+        if self.cpu.hires_changed:
+            # Mode switch: resize, then redraw the whole frame
             self.cpu.draw_flag = False
-            
-            # Update mode label
-            if self.cpu.hires_mode:
-                self.mode_label.config(text="128×64")
-            else:
-                self.mode_label.config(text="64×32")
-        
-        # Update FPS counter
-        self.frame_count += 1
-        now = time.time()
-        if now - self.last_fps_time >= 1.0:
-            self.fps = self.frame_count
-            self.frame_count = 0
-            self.last_fps_time = now
-            self.fps_label.config(text=f"FPS: {self.fps}")
+            self.cpu.dirty_rows = 0
+            self._sync_display_mode()
+            self.display_renderer.render(self.cpu.display)
+        elif self.cpu.draw_flag:
+            self.cpu.draw_flag = False
+            dirty_rows = self.cpu.dirty_rows
+            self.cpu.dirty_rows = 0
+            self.display_renderer.render(self.cpu.display, dirty_rows)
+    
+    def _fps_loop(self):
+        """Publish emulated frames per second once a second"""
+        if not self._emu_running:
+            return
         
-        # Schedule next render
-        self.root.after(1000 // 60, self._render_loop)
+        self.fps = self.frame_count
+        self.frame_count = 0
+        self.fps_label.config(text=f"FPS: {self.fps}")
+        self.root.after(1000, self._fps_loop)
+    
+    def _sync_display_mode(self):
+        """Match renderer resolution and mode label to the CPU display mode"""
+        self.cpu.hires_changed = False
+        if self.cpu.hires_mode:
+            self.display_renderer.set_resolution(self.config.hires_width,
+                                                 self.config.hires_height)
+            self.mode_label.config(text="128×64")
+        else:
+            self.display_renderer.set_resolution(self.config.lores_width,
+                                                 self.config.lores_height)
+            self.mode_label.config(text="64×32")
     
     def _update_status(self):
         """Update status bar"""
@@ -1243,12 +1898,11 @@ class Chip8GUI:
     def _reset(self):
         """Reset emulator with current ROM"""
         if self.cpu.rom_loaded:
-            # Re-load ROM
-            rom_data = bytes(self.cpu.memory[self.config.program_start:
-                                             self.config.program_start + self.cpu.rom_size])
-            name = self.cpu.rom_name
-            self.cpu.load_rom(rom_data, name)
-            self.display_renderer.render(self.cpu.display, self.cpu.hires_mode)
+            # Re-load the ROM image as read from disk (memory may have
+            # been modified by the program since)
+            self.cpu.load_rom(self._rom_data, self.cpu.rom_name)
+            self._sync_display_mode()
+            self.display_renderer.render(self.cpu.display)
             self._update_status()
     
     def _toggle_pause(self):
@@ -1261,12 +1915,12 @@ class Chip8GUI:
         if not self.cpu.rom_loaded:
             return
         
-        state = self.cpu.get_state()
         save_path = f"{self.cpu.rom_name}.sav"
         
         try:
+            data = self.cpu.get_state_bytes()
             with open(save_path, 'wb') as f:
-                pickle.dump(state, f)
+                f.write(data)
             self.state_label.config(text="💾 Saved!")
             self.root.after(1000, self._update_status)
         except Exception as e:
@@ -1281,9 +1935,10 @@ class Chip8GUI:
         
         try:
             with open(save_path, 'rb') as f:
-                state = pickle.load(f)
-            self.cpu.load_state(state)
-            self.display_renderer.render(self.cpu.display, self.cpu.hires_mode)
+                data = f.read()
+            self.cpu.load_state_bytes(data)
+            self._sync_display_mode()
+            self.display_renderer.render(self.cpu.display)
             self.state_label.config(text="📂 Loaded!")
             self.root.after(1000, self._update_status)
         except FileNotFoundError:
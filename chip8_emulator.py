@@ -8,11 +8,15 @@ Author: Team Flames / Samsoft
 import tkinter as tk
 from tkinter import messagebox
 import threading
+import queue
 import time
 import random
 import pickle
+import gzip
+import struct
 import os
 import sys
+from array import array
 from typing import Optional, Callable
 from dataclasses import dataclass, field
 
@@ -47,6 +51,17 @@ STATUS_FG = "#888888"
 CPU_FREQUENCY = 500
 TIMER_FREQUENCY = 60
 TARGET_FPS = 60
+MAX_AUTO_RESETS = 3  # Consecutive crash resets before pausing
+
+# Save files: gzip of a fixed big-endian layout - header (magic, version,
+# PC, I, SP, delay/sound timers), then memory, V, stack, display rows, keys
+SAVE_MAGIC = b"C8SV"
+SAVE_VERSION = 1
+SAVE_HEADER = struct.Struct(">4sBHHhBB")
+SAVE_STACK = struct.Struct(f">{STACK_SIZE}H")
+SAVE_DISPLAY = struct.Struct(f">{DISPLAY_HEIGHT}Q")
+SAVE_SIZE = (SAVE_HEADER.size + MEMORY_SIZE + NUM_REGISTERS + SAVE_STACK.size
+             + SAVE_DISPLAY.size + NUM_KEYS)
 
 # CHIP-8 Font sprites (0-F)
 FONTSET = [
@@ -67,6 +82,29 @@ FONTSET = [
     0xF0, 0x80, 0xF0, 0x80, 0xF0,  # E
     0xF0, 0x80, 0xF0, 0x80, 0x80,  # F
 ]
+FONTSET_BYTES = bytes(FONTSET)
+
+# Cleared display rows, copied in place on CLS
+BLANK_DISPLAY = (0,) * DISPLAY_HEIGHT
+
+# Big-endian 16-bit opcode fetch: (opcode,) = FETCH_OPCODE(memory, pc)
+FETCH_OPCODE = struct.Struct(">H").unpack_from
+
+# FX33 digits for every byte value, three bytes per value
+BCD_TABLE = b"".join(bytes((v // 100, (v // 10) % 10, v % 10)) for v in range(256))
+
+# FX29 font sprite address for every byte value (low nibble selects the digit)
+FONT_ADDRESSES = tuple(FONT_START + (v & 0xF) * 5 for v in range(256))
+
+# Tcl helper applying a frame's row updates to a photo image in one call;
+# _tkinter releases the GIL for the whole call, so the CPU thread keeps running
+PUT_ROWS_PROC = """
+proc chip8_put_rows {img updates} {
+    foreach {data x1 y1 x2 y2} $updates {
+        $img put $data -to $x1 $y1 $x2 $y2
+    }
+}
+"""
 
 # Keyboard mapping (CHIP-8 key -> keyboard key)
 KEYBOARD_MAP = {
@@ -81,7 +119,7 @@ KEYBOARD_MAP = {
 class EmulatorState:
     """Complete emulator state for save/load"""
     memory: bytearray
-    v: list
+    v: bytes
     i: int
     pc: int
     stack: list
@@ -89,7 +127,7 @@ class EmulatorState:
     delay_timer: int
     sound_timer: int
     display: list
-    keys: list
+    keys: bytes
 
 
 class Chip8Audio:
@@ -148,7 +186,7 @@ class Chip8Controller:
         self.connection_type = "None"
         self.battery_level = -1
         self.running = False
-        self._thread: Optional[threading.Thread] = None
+        self._after: Optional[Callable] = None
         
         # Special action callbacks
         self.on_reset: Optional[Callable] = None
@@ -166,31 +204,36 @@ class Chip8Controller:
         self._touchpad_held = False
         self.on_debug_toggle: Optional[Callable] = None
         
+        # Button/hat state from the previous poll
+        self._prev_buttons = []
+        self._prev_hat = (0, 0)
+        
         if PYGAME_AVAILABLE:
             pygame.init()
             pygame.joystick.init()
+            # Input is read from joystick state, so keep the event queue empty
+            pygame.event.set_blocked(None)
     
-    def start(self):
-        """Start controller polling thread"""
+    def start(self, after: Callable[[int, Callable], object]):
+        """Start controller polling on the caller's event loop (e.g. Tk's after)"""
         if not PYGAME_AVAILABLE:
             return
         self.running = True
-        self._thread = threading.Thread(target=self._poll_loop, daemon=True)
-        self._thread.start()
+        self._after = after
+        self._poll()
     
     def stop(self):
         """Stop controller polling"""
         self.running = False
-        if self._thread:
-            self._thread.join(timeout=1.0)
     
-    def _poll_loop(self):
-        """Main controller polling loop"""
-        while self.running:
-            self._check_connection()
-            if self.connected:
-                self._process_input()
-            time.sleep(1/120)  # 120Hz polling
+    def _poll(self):
+        """Poll the controller once and schedule the next poll"""
+        if not self.running:
+            return
+        self._check_connection()
+        if self.connected:
+            self._process_input()
+        self._after(1000 // TARGET_FPS, self._poll)  # 60Hz polling
     
     def _check_connection(self):
         """Check for controller connection/disconnection"""
@@ -203,6 +246,8 @@ class Chip8Controller:
             self.joystick = pygame.joystick.Joystick(0)
             self.joystick.init()
             self.connected = True
+            self._prev_buttons = [False] * self.joystick.get_numbuttons()
+            self._prev_hat = (0, 0)
             
             # Determine connection type (heuristic)
             name = self.joystick.get_name().lower()
@@ -230,14 +275,24 @@ class Chip8Controller:
         """Process controller input and map to CHIP-8 keys"""
         if not self.joystick:
             return
-            
-        for event in pygame.event.get():
-            if event.type == pygame.JOYBUTTONDOWN:
-                self._handle_button_down(event.button)
-            elif event.type == pygame.JOYBUTTONUP:
-                self._handle_button_up(event.button)
-            elif event.type == pygame.JOYHATMOTION:
-                self._handle_hat(event.value)
+        
+        # State was refreshed by the pump in _check_connection; diff it
+        # against the previous poll instead of draining the event queue
+        prev_buttons = self._prev_buttons
+        for button in range(len(prev_buttons)):
+            pressed = bool(self.joystick.get_button(button))
+            if pressed != prev_buttons[button]:
+                prev_buttons[button] = pressed
+                if pressed:
+                    self._handle_button_down(button)
+                else:
+                    self._handle_button_up(button)
+        
+        if self.joystick.get_numhats():
+            hat = self.joystick.get_hat(0)
+            if hat != self._prev_hat:
+                self._prev_hat = hat
+                self._handle_hat(hat)
     
     def _handle_button_down(self, button: int):
         """Handle button press"""
@@ -355,6 +410,18 @@ class Chip8CPU:
     """CHIP-8 CPU core with all 35 opcodes"""
     
     def __init__(self):
+        # FXNN handlers by NN; every other opcode is inlined in run_cycles
+        self._dispatch_f = {
+            0x07: self._op_fx07,
+            0x0A: self._op_fx0a,
+            0x15: self._op_fx15,
+            0x18: self._op_fx18,
+            0x1E: self._op_fx1e,
+            0x29: self._op_fx29,
+            0x33: self._op_fx33,
+            0x55: self._op_fx55,
+            0x65: self._op_fx65,
+        }
         self.reset()
     
     def reset(self):
@@ -363,27 +430,29 @@ class Chip8CPU:
         self.memory = bytearray(MEMORY_SIZE)
         
         # Load font into memory
-        for i, byte in enumerate(FONTSET):
-            self.memory[FONT_START + i] = byte
+        self.memory[FONT_START:FONT_START + len(FONTSET_BYTES)] = FONTSET_BYTES
         
         # Registers
-        self.v = [0] * NUM_REGISTERS  # V0-VF
+        self.v = bytearray(NUM_REGISTERS)  # V0-VF
         self.i = 0  # Index register
         self.pc = PROGRAM_START  # Program counter
         
         # Stack
-        self.stack = [0] * STACK_SIZE
+        self.stack = array('H', [0] * STACK_SIZE)  # 16-bit return addresses
         self.sp = 0  # Stack pointer
         
         # Timers
         self.delay_timer = 0
         self.sound_timer = 0
         
-        # Display (64x32 pixels)
-        self.display = [[0] * DISPLAY_WIDTH for _ in range(DISPLAY_HEIGHT)]
+        # Display (64x32 pixels, one int per row, bit 63 is column 0)
+        self.display = list(BLANK_DISPLAY)
         
         # Input
-        self.keys = [False] * NUM_KEYS
+        self.keys = 0  # Bit k is set while key k is held
+        
+        # Random source for CXNN
+        self._rand8 = random.getrandbits
         
         # State flags
         self.draw_flag = False
@@ -393,231 +462,253 @@ class Chip8CPU:
         # ROM info
         self.rom_loaded = False
         self.rom_name = ""
+        self.rom_data = b""  # ROM as loaded, before any self-modification
     
     def load_rom(self, data: bytes, name: str = ""):
         """Load ROM data into memory"""
         self.reset()
-        for i, byte in enumerate(data):
-            if PROGRAM_START + i < MEMORY_SIZE:
-                self.memory[PROGRAM_START + i] = byte
+        # Anything past the end of memory is dropped
+        end = min(PROGRAM_START + len(data), MEMORY_SIZE)
+        self.rom_data = bytes(data[:end - PROGRAM_START])
+        self.memory[PROGRAM_START:end] = self.rom_data
+        self.rom_loaded = True
+        self.rom_name = name or "Unknown"
+    
+    def load_rom_file(self, f, name: str = ""):
+        """Load ROM from a binary file object straight into memory"""
+        self.reset()
+        # Anything past the end of memory is left unread
+        with memoryview(self.memory) as view:
+            size = f.readinto(view[PROGRAM_START:])
+        self.rom_data = bytes(self.memory[PROGRAM_START:PROGRAM_START + size])
         self.rom_loaded = True
         self.rom_name = name or "Unknown"
     
     def cycle(self):
         """Execute one CPU cycle"""
+        # Same interpreter as a frame's batch, so the two cannot drift apart
+        self.run_cycles(1)
+    
+    def run_cycles(self, cycles: int):
+        """Execute up to `cycles` CPU cycles in one call"""
         if self.waiting_for_key:
             return
         
-        # Fetch opcode (2 bytes)
-        opcode = (self.memory[self.pc] << 8) | self.memory[self.pc + 1]
+        # The core runs inside this one frame with PC, I, SP and the memory
+        # arrays in locals. Only FXNN goes out to a handler, so PC and I are
+        # written back before that call and reloaded after it.
+        # Opcode groups are a frequency-ordered if/elif chain rather than a
+        # table of handlers: a bound-method call per opcode is slower than
+        # the handful of int compares it saves, and would need PC and I
+        # synced around every opcode instead of only FXNN.
+        mem = self.memory
+        v = self.v
+        stack = self.stack
+        keys = self.keys
+        display = self.display
+        rand8 = self._rand8
+        dispatch_f = self._dispatch_f
+        fetch = FETCH_OPCODE
+        pc = self.pc
+        i = self.i
+        sp = self.sp
         
-        # Decode and execute
-        self._execute(opcode)
-    
-    def _execute(self, opcode: int):
-        """Decode and execute opcode"""
-        # Extract common parts
-        nnn = opcode & 0x0FFF  # 12-bit address
-        nn = opcode & 0x00FF   # 8-bit constant
-        n = opcode & 0x000F    # 4-bit constant
-        x = (opcode >> 8) & 0x0F  # Register X
-        y = (opcode >> 4) & 0x0F  # Register Y
-        
-        first = opcode >> 12
-        
-        if opcode == 0x00E0:
-            # 00E0: Clear screen
-            self.display = [[0] * DISPLAY_WIDTH for _ in range(DISPLAY_HEIGHT)]
-            self.draw_flag = True
-            self.pc += 2
-            
-        elif opcode == 0x00EE:
-            # 00EE: Return from subroutine
-            self.sp -= 1
-            self.pc = self.stack[self.sp]
-            self.pc += 2
-            
-        elif first == 0x1:
-            # 1NNN: Jump to NNN
-            self.pc = nnn
-            
-        elif first == 0x2:
-            # 2NNN: Call subroutine at NNN
-            self.stack[self.sp] = self.pc
-            self.sp += 1
-            self.pc = nnn
-            
-        elif first == 0x3:
-            # 3XNN: Skip if VX == NN
-            self.pc += 4 if self.v[x] == nn else 2
-            
-        elif first == 0x4:
-            # 4XNN: Skip if VX != NN
-            self.pc += 4 if self.v[x] != nn else 2
-            
-        elif first == 0x5 and n == 0:
-            # 5XY0: Skip if VX == VY
-            self.pc += 4 if self.v[x] == self.v[y] else 2
-            
-        elif first == 0x6:
-            # 6XNN: VX = NN
-            self.v[x] = nn
-            self.pc += 2
-            
-        elif first == 0x7:
-            # 7XNN: VX += NN (no carry)
-            self.v[x] = (self.v[x] + nn) & 0xFF
-            self.pc += 2
-            
-        elif first == 0x8:
-            self._execute_8xxx(opcode, x, y, n)
-            
-        elif first == 0x9 and n == 0:
-            # 9XY0: Skip if VX != VY
-            self.pc += 4 if self.v[x] != self.v[y] else 2
-            
-        elif first == 0xA:
-            # ANNN: I = NNN
-            self.i = nnn
-            self.pc += 2
-            
-        elif first == 0xB:
-            # BNNN: Jump to NNN + V0
-            self.pc = nnn + self.v[0]
-            
-        elif first == 0xC:
-            # CXNN: VX = random & NN
-            self.v[x] = random.randint(0, 255) & nn
-            self.pc += 2
-            
-        elif first == 0xD:
-            # DXYN: Draw sprite
-            self._draw_sprite(x, y, n)
-            self.pc += 2
-            
-        elif first == 0xE:
-            if nn == 0x9E:
-                # EX9E: Skip if key VX pressed
-                self.pc += 4 if self.keys[self.v[x] & 0xF] else 2
-            elif nn == 0xA1:
-                # EXA1: Skip if key VX not pressed
-                self.pc += 4 if not self.keys[self.v[x] & 0xF] else 2
-            else:
-                self.pc += 2
+        try:
+            for _ in range(cycles):
+                (opcode,) = fetch(mem, pc)
+                first = opcode >> 12
                 
-        elif first == 0xF:
-            self._execute_fxxx(opcode, x, nn)
-            
-        else:
-            # Unknown opcode, skip
-            self.pc += 2
+                if first == 0xD:
+                    # DXYN: Draw sprite, clipped at the edges
+                    px = v[(opcode >> 8) & 0x0F] % DISPLAY_WIDTH
+                    py = v[(opcode >> 4) & 0x0F] % DISPLAY_HEIGHT
+                    collision = 0
+                    for row in range(min(opcode & 0x000F, DISPLAY_HEIGHT - py)):
+                        mask = (mem[i + row] << (DISPLAY_WIDTH - 8)) >> px
+                        old = display[py + row]
+                        if old & mask:
+                            collision = 1
+                        display[py + row] = old ^ mask
+                    v[0xF] = collision
+                    self.draw_flag = True
+                    pc += 2
+                elif first == 0x6:
+                    # 6XNN: VX = NN
+                    v[(opcode >> 8) & 0x0F] = opcode & 0xFF
+                    pc += 2
+                elif first == 0x7:
+                    # 7XNN: VX += NN (no carry)
+                    x = (opcode >> 8) & 0x0F
+                    v[x] = (v[x] + (opcode & 0xFF)) & 0xFF
+                    pc += 2
+                elif first == 0xA:
+                    # ANNN: I = NNN
+                    i = opcode & 0x0FFF
+                    pc += 2
+                elif first == 0x3:
+                    # 3XNN: Skip if VX == NN
+                    pc += 4 if v[(opcode >> 8) & 0x0F] == opcode & 0xFF else 2
+                elif first == 0x4:
+                    # 4XNN: Skip if VX != NN
+                    pc += 4 if v[(opcode >> 8) & 0x0F] != opcode & 0xFF else 2
+                elif first == 0x1:
+                    # 1NNN: Jump to NNN
+                    if opcode & 0x0FFF == pc:
+                        # Jump to self: nothing can change until the frame's
+                        # timers or input do, so end the batch early
+                        break
+                    pc = opcode & 0x0FFF
+                elif first == 0x8:
+                    # 8XYN: ALU operations
+                    x = (opcode >> 8) & 0x0F
+                    y = (opcode >> 4) & 0x0F
+                    n = opcode & 0x000F
+                    if n == 0x0:
+                        v[x] = v[y]
+                    elif n == 0x1:
+                        v[x] |= v[y]
+                        v[0xF] = 0
+                    elif n == 0x2:
+                        v[x] &= v[y]
+                        v[0xF] = 0
+                    elif n == 0x3:
+                        v[x] ^= v[y]
+                        v[0xF] = 0
+                    elif n == 0x4:
+                        result = v[x] + v[y]
+                        v[x] = result & 0xFF
+                        v[0xF] = 1 if result > 255 else 0
+                    elif n == 0x5:
+                        borrow = 1 if v[x] >= v[y] else 0
+                        v[x] = (v[x] - v[y]) & 0xFF
+                        v[0xF] = borrow
+                    elif n == 0x6:
+                        lsb = v[x] & 1
+                        v[x] = v[x] >> 1
+                        v[0xF] = lsb
+                    elif n == 0x7:
+                        borrow = 1 if v[y] >= v[x] else 0
+                        v[x] = (v[y] - v[x]) & 0xFF
+                        v[0xF] = borrow
+                    elif n == 0xE:
+                        msb = (v[x] >> 7) & 1
+                        v[x] = (v[x] << 1) & 0xFF
+                        v[0xF] = msb
+                    pc += 2
+                elif first == 0x2:
+                    # 2NNN: Call subroutine at NNN
+                    stack[sp] = pc
+                    sp += 1
+                    pc = opcode & 0x0FFF
+                elif first == 0x0:
+                    if opcode == 0x00E0:
+                        # 00E0: Clear screen
+                        display[:] = BLANK_DISPLAY
+                        self.draw_flag = True
+                        pc += 2
+                    elif opcode == 0x00EE:
+                        # 00EE: Return from subroutine
+                        sp -= 1
+                        pc = stack[sp] + 2
+                    else:
+                        pc += 2
+                elif first == 0xF:
+                    # FXNN: out of line, with PC and I synced
+                    handler = dispatch_f.get(opcode & 0xFF)
+                    if handler is None:
+                        pc += 2
+                    else:
+                        self.pc = pc
+                        self.i = i
+                        if handler((opcode >> 8) & 0x0F) is None:
+                            pc += 2
+                        i = self.i
+                        if self.waiting_for_key:
+                            break
+                elif first == 0xE:
+                    nn = opcode & 0xFF
+                    if nn == 0x9E:
+                        # EX9E: Skip if key VX pressed
+                        pc += 4 if (keys >> (v[(opcode >> 8) & 0x0F] & 0xF)) & 1 else 2
+                    elif nn == 0xA1:
+                        # EXA1: Skip if key VX not pressed
+                        pc += 2 if (keys >> (v[(opcode >> 8) & 0x0F] & 0xF)) & 1 else 4
+                    else:
+                        pc += 2
+                elif first == 0x5 or first == 0x9:
+                    # 5XY0/9XY0: Skip if VX ==/!= VY
+                    equal = v[(opcode >> 8) & 0x0F] == v[(opcode >> 4) & 0x0F]
+                    if opcode & 0x000F == 0 and equal == (first == 0x5):
+                        pc += 4
+                    else:
+                        pc += 2
+                elif first == 0xB:
+                    # BNNN: Jump to NNN + V0
+                    pc = (opcode & 0x0FFF) + v[0]
+                else:
+                    # CXNN: VX = random & NN
+                    v[(opcode >> 8) & 0x0F] = rand8(8) & opcode & 0xFF
+                    pc += 2
+        except struct.error:
+            # Fetch ran off the end of memory; fault like an indexed read
+            raise IndexError(f"opcode fetch past end of memory: ${pc:04X}") from None
+        finally:
+            self.pc = pc
+            self.i = i
+            self.sp = sp
     
-    def _execute_8xxx(self, opcode: int, x: int, y: int, n: int):
-        """Execute 8xxx opcodes (ALU operations)"""
-        if n == 0x0:
-            # 8XY0: VX = VY
-            self.v[x] = self.v[y]
-        elif n == 0x1:
-            # 8XY1: VX |= VY
-            self.v[x] |= self.v[y]
-            self.v[0xF] = 0  # Quirk: VF reset
-        elif n == 0x2:
-            # 8XY2: VX &= VY
-            self.v[x] &= self.v[y]
-            self.v[0xF] = 0  # Quirk: VF reset
-        elif n == 0x3:
-            # 8XY3: VX ^= VY
-            self.v[x] ^= self.v[y]
-            self.v[0xF] = 0  # Quirk: VF reset
-        elif n == 0x4:
-            # 8XY4: VX += VY with carry
-            result = self.v[x] + self.v[y]
-            self.v[x] = result & 0xFF
-            self.v[0xF] = 1 if result > 255 else 0
-        elif n == 0x5:
-            # 8XY5: VX -= VY with borrow
-            borrow = 1 if self.v[x] >= self.v[y] else 0
-            self.v[x] = (self.v[x] - self.v[y]) & 0xFF
-            self.v[0xF] = borrow
-        elif n == 0x6:
-            # 8XY6: VX >>= 1
-            lsb = self.v[x] & 1
-            self.v[x] = self.v[x] >> 1
-            self.v[0xF] = lsb
-        elif n == 0x7:
-            # 8XY7: VX = VY - VX with borrow
-            borrow = 1 if self.v[y] >= self.v[x] else 0
-            self.v[x] = (self.v[y] - self.v[x]) & 0xFF
-            self.v[0xF] = borrow
-        elif n == 0xE:
-            # 8XYE: VX <<= 1
-            msb = (self.v[x] >> 7) & 1
-            self.v[x] = (self.v[x] << 1) & 0xFF
-            self.v[0xF] = msb
-        
-        self.pc += 2
-    
-    def _execute_fxxx(self, opcode: int, x: int, nn: int):
-        """Execute Fxxx opcodes"""
-        if nn == 0x07:
-            # FX07: VX = delay timer
-            self.v[x] = self.delay_timer
-        elif nn == 0x0A:
-            # FX0A: Wait for key press
-            self.waiting_for_key = True
-            self.key_register = x
-            return  # Don't increment PC yet
-        elif nn == 0x15:
-            # FX15: delay timer = VX
-            self.delay_timer = self.v[x]
-        elif nn == 0x18:
-            # FX18: sound timer = VX
-            self.sound_timer = self.v[x]
-        elif nn == 0x1E:
-            # FX1E: I += VX
-            self.i = (self.i + self.v[x]) & 0xFFFF
-        elif nn == 0x29:
-            # FX29: I = font sprite for VX
-            self.i = FONT_START + (self.v[x] & 0xF) * 5
-        elif nn == 0x33:
-            # FX33: Store BCD of VX at I, I+1, I+2
-            value = self.v[x]
-            self.memory[self.i] = value // 100
-            self.memory[self.i + 1] = (value // 10) % 10
-            self.memory[self.i + 2] = value % 10
-        elif nn == 0x55:
-            # FX55: Store V0-VX at I
-            for i in range(x + 1):
-                self.memory[self.i + i] = self.v[i]
-        elif nn == 0x65:
-            # FX65: Load V0-VX from I
-            for i in range(x + 1):
-                self.v[i] = self.memory[self.i + i]
-        
-        self.pc += 2
-    
-    def _draw_sprite(self, x: int, y: int, n: int):
-        """Draw sprite at (VX, VY) with height N"""
-        px = self.v[x] % DISPLAY_WIDTH
-        py = self.v[y] % DISPLAY_HEIGHT
-        self.v[0xF] = 0
-        
-        for row in range(n):
-            if py + row >= DISPLAY_HEIGHT:
-                break
-            sprite_byte = self.memory[self.i + row]
-            
-            for col in range(8):
-                if px + col >= DISPLAY_WIDTH:
-                    break
-                if sprite_byte & (0x80 >> col):
-                    dx = px + col
-                    dy = py + row
-                    if self.display[dy][dx] == 1:
-                        self.v[0xF] = 1  # Collision
-                    self.display[dy][dx] ^= 1
-        
-        self.draw_flag = True
+    def _op_fx07(self, x: int):
+        # FX07: VX = delay timer
+        self.v[x] = self.delay_timer
+    
+    def _op_fx0a(self, x: int):
+        # FX0A: Wait for key press
+        self.waiting_for_key = True
+        self.key_register = x
+        return True  # Don't increment PC yet
+    
+    def _op_fx15(self, x: int):
+        # FX15: delay timer = VX
+        self.delay_timer = self.v[x]
+    
+    def _op_fx18(self, x: int):
+        # FX18: sound timer = VX
+        self.sound_timer = self.v[x]
+    
+    def _op_fx1e(self, x: int):
+        # FX1E: I += VX
+        self.i = (self.i + self.v[x]) & 0xFFFF
+    
+    def _op_fx29(self, x: int):
+        # FX29: I = font sprite for VX
+        self.i = FONT_ADDRESSES[self.v[x]]
+    
+    def _op_fx33(self, x: int):
+        # FX33: Store BCD of VX at I, I+1, I+2
+        if self.i + 3 > MEMORY_SIZE:
+            raise IndexError("BCD store past end of memory")
+        offset = self.v[x] * 3
+        self.memory[self.i:self.i + 3] = BCD_TABLE[offset:offset + 3]
+    
+    def _op_fx55(self, x: int):
+        # FX55: Store V0-VX at I
+        if self.i + x + 1 > MEMORY_SIZE:
+            raise IndexError("register store past end of memory")
+        self.memory[self.i:self.i + x + 1] = self.v[:x + 1]
+    
+    def _op_fx65(self, x: int):
+        # FX65: Load V0-VX from I
+        if self.i + x + 1 > MEMORY_SIZE:
+            raise IndexError("register load past end of memory")
+        self.v[:x + 1] = self.memory[self.i:self.i + x + 1]
+    
+    def set_key(self, key: int, pressed: bool):
+        """Update the held state of a key, completing FX0A on a press"""
+        if pressed:
+            self.keys |= 1 << key
+            self.key_pressed(key)
+        else:
+            self.keys &= ~(1 << key)
     
     def key_pressed(self, key: int):
         """Handle key press"""
@@ -637,30 +728,71 @@ class Chip8CPU:
         """Get current state for save"""
         return EmulatorState(
             memory=bytearray(self.memory),
-            v=list(self.v),
+            v=bytes(self.v),
             i=self.i,
             pc=self.pc,
             stack=list(self.stack),
             sp=self.sp,
             delay_timer=self.delay_timer,
             sound_timer=self.sound_timer,
-            display=[row[:] for row in self.display],
-            keys=list(self.keys)
+            display=list(self.display),
+            keys=bytes((self.keys >> k) & 1 for k in range(NUM_KEYS))
         )
     
     def load_state(self, state: EmulatorState):
         """Load state from save"""
         self.memory = bytearray(state.memory)
-        self.v = list(state.v)
+        self.v = bytearray(state.v)
         self.i = state.i
         self.pc = state.pc
-        self.stack = list(state.stack)
+        self.stack = array('H', state.stack)
         self.sp = state.sp
         self.delay_timer = state.delay_timer
         self.sound_timer = state.sound_timer
-        self.display = [row[:] for row in state.display]
-        self.keys = list(state.keys)
+        # Older pickled saves hold each row as a list of 64 pixels
+        self.display[:] = [
+            row if isinstance(row, int) else int("".join("1" if p else "0" for p in row), 2)
+            for row in state.display
+        ]
+        self.keys = sum(1 << k for k, held in enumerate(state.keys) if held)
         self.draw_flag = True
+    
+    def get_state_bytes(self) -> bytes:
+        """Get current state in the binary save layout"""
+        return b"".join((
+            SAVE_HEADER.pack(SAVE_MAGIC, SAVE_VERSION, self.pc, self.i, self.sp,
+                             self.delay_timer, self.sound_timer),
+            self.memory,
+            self.v,
+            SAVE_STACK.pack(*self.stack),
+            SAVE_DISPLAY.pack(*self.display),
+            bytes((self.keys >> k) & 1 for k in range(NUM_KEYS)),
+        ))
+    
+    def load_state_bytes(self, data: bytes):
+        """Load state from the binary save layout"""
+        if len(data) != SAVE_SIZE or data[:len(SAVE_MAGIC)] != SAVE_MAGIC:
+            raise ValueError("not a CHIP-8 save state")
+        magic, version, pc, i, sp, delay_timer, sound_timer = SAVE_HEADER.unpack_from(data)
+        if version != SAVE_VERSION:
+            raise ValueError(f"unsupported save state version {version}")
+        
+        offset = SAVE_HEADER.size
+        memory = data[offset:offset + MEMORY_SIZE]
+        offset += MEMORY_SIZE
+        v = data[offset:offset + NUM_REGISTERS]
+        offset += NUM_REGISTERS
+        stack = SAVE_STACK.unpack_from(data, offset)
+        offset += SAVE_STACK.size
+        display = SAVE_DISPLAY.unpack_from(data, offset)
+        offset += SAVE_DISPLAY.size
+        keys = data[offset:offset + NUM_KEYS]
+        
+        self.load_state(EmulatorState(
+            memory=memory, v=v, i=i, pc=pc, stack=stack, sp=sp,
+            delay_timer=delay_timer, sound_timer=sound_timer,
+            display=display, keys=keys
+        ))
 
 
 class Chip8Display:
@@ -671,28 +803,47 @@ class Chip8Display:
         self.scale_x = WINDOW_WIDTH / DISPLAY_WIDTH
         self.scale_y = DISPLAY_AREA_HEIGHT / DISPLAY_HEIGHT
         self.scanlines_enabled = False
-        self.pixel_rects = {}
         
-        # Pre-create pixel rectangles for efficiency
-        self._create_pixels()
+        # Scaled image the display is blitted into
+        self._create_image()
     
-    def _create_pixels(self):
-        """Pre-create all pixel rectangles"""
+    def _create_image(self):
+        """Create the photo image and per-byte row color tables"""
         self.canvas.delete("all")
-        self.pixel_rects = {}
+        self.photo = tk.PhotoImage(width=WINDOW_WIDTH, height=DISPLAY_AREA_HEIGHT)
+        self.photo.put(BG_COLOR, to=(0, 0, WINDOW_WIDTH, DISPLAY_AREA_HEIGHT))
+        self.canvas.create_image(0, 0, anchor=tk.NW, image=self.photo)
+        self.canvas.tk.eval(PUT_ROWS_PROC)
         
-        for y in range(DISPLAY_HEIGHT):
-            for x in range(DISPLAY_WIDTH):
-                x1 = x * self.scale_x
-                y1 = y * self.scale_y
-                x2 = x1 + self.scale_x
-                y2 = y1 + self.scale_y
-                
-                rect = self.canvas.create_rectangle(
-                    x1, y1, x2, y2,
-                    fill=BG_COLOR, outline=""
-                )
-                self.pixel_rects[(x, y)] = rect
+        # Rows as currently shown in the image, diffed against on render
+        self.shown_rows = [0] * DISPLAY_HEIGHT
+        
+        # Image columns covered by each display column
+        widths = [int((x + 1) * self.scale_x) - int(x * self.scale_x)
+                  for x in range(DISPLAY_WIDTH)]
+        
+        # For each 8-pixel column group, the image row colors of every byte value.
+        # Groups with the same column widths share a table, so with an evenly
+        # dividing scale only one is built at startup.
+        self.group_colors = []
+        tables = {}
+        for g in range(DISPLAY_WIDTH // 8):
+            group_widths = tuple(widths[g * 8:g * 8 + 8])
+            table = tables.get(group_widths)
+            if table is None:
+                table = []
+                for byte in range(256):
+                    colors = []
+                    for col in range(8):
+                        color = PIXEL_COLOR if byte & (0x80 >> col) else BG_COLOR
+                        colors.extend([color] * group_widths[col])
+                    table.append(" ".join(colors))
+                tables[group_widths] = table
+            self.group_colors.append(table)
+        
+        # Image bounds of each column group and display row, indexed by position
+        self.group_x = [int(g * 8 * self.scale_x) for g in range(DISPLAY_WIDTH // 8 + 1)]
+        self.row_y = [int(y * self.scale_y) for y in range(DISPLAY_HEIGHT + 1)]
         
         # Create scanline overlay (initially hidden)
         self.scanline_rects = []
@@ -721,12 +872,39 @@ class Chip8Display:
     
     def render(self, display: list):
         """Render CHIP-8 display to canvas"""
+        # Sprites often redraw what is already shown; a whole-frame list
+        # compare runs in C and skips the per-row pass when nothing changed
+        if display == self.shown_rows:
+            return
+        
+        groups = self.group_colors
+        group_x = self.group_x
+        row_y = self.row_y
+        shown = self.shown_rows
+        updates = []
         for y in range(DISPLAY_HEIGHT):
-            for x in range(DISPLAY_WIDTH):
-                color = PIXEL_COLOR if display[y][x] else BG_COLOR
-                rect = self.pixel_rects.get((x, y))
-                if rect:
-                    self.canvas.itemconfig(rect, fill=color)
+            row = display[y]
+            diff = row ^ shown[y]
+            if not diff:
+                continue
+            shown[y] = row
+            
+            # Span of 8-pixel column groups holding the changed pixels
+            first = (DISPLAY_WIDTH - diff.bit_length()) // 8
+            last = (DISPLAY_WIDTH - (diff & -diff).bit_length()) // 8
+            row_bytes = row.to_bytes(DISPLAY_WIDTH // 8, "big")
+            data = " ".join([
+                table[byte] for table, byte
+                in zip(groups[first:last + 1], row_bytes[first:last + 1])
+            ])
+            
+            # One image row, tiled down over the display row's height
+            updates += ("{" + data + "}", group_x[first], row_y[y],
+                        group_x[last + 1], row_y[y + 1])
+        
+        # All strings are built before entering Tcl; the blit is one call
+        if updates:
+            self.canvas.tk.call("chip8_put_rows", self.photo, updates)
 
 
 class Chip8GUI:
@@ -741,16 +919,29 @@ class Chip8GUI:
         
         # Components
         self.cpu = Chip8CPU()
+        # Serializes CPU access between the Tk and emulation threads; needed
+        # for correctness on free-threaded builds, cheap once per frame with a GIL
+        self._cpu_lock = threading.Lock()
         self.audio = Chip8Audio()
         
         # State
         self.running = False
         self.paused = False
+        # Set while emulating; the emulation thread blocks on it when paused
+        self._run_event = threading.Event()
+        self._run_event.set()
+        # Crashes reported by the emulation thread, handled on the Tk side;
+        # each item is the count of consecutive crashed frames
+        self._crashes: queue.Queue = queue.Queue()
         self.speed_multiplier = 1
+        self._cycles_per_frame = CPU_FREQUENCY // TARGET_FPS
         self.fps = 0
         self.frame_count = 0
-        self.last_fps_time = time.time()
+        self.last_fps_time = time.perf_counter()
+        self._shown_fps = -1  # Value on the FPS label, to skip unchanged updates
         self.show_debug = False
+        self._render_pending = False
+        self._next_render = 0.0
         
         # Create UI
         self._create_ui()
@@ -768,15 +959,12 @@ class Chip8GUI:
         # Enable drag and drop
         self._setup_drag_drop()
         
-        # Start controller polling
-        self.controller.start()
+        # Start controller polling on the Tk event loop
+        self.controller.start(self.root.after)
         
         # Emulation thread
         self._emu_thread: Optional[threading.Thread] = None
         self._emu_running = False
-        
-        # Timer thread
-        self._timer_thread: Optional[threading.Thread] = None
     
     def _create_ui(self):
         """Create UI components"""
@@ -864,21 +1052,21 @@ class Chip8GUI:
         key = event.keysym.lower()
         if key in KEYBOARD_MAP:
             chip8_key = KEYBOARD_MAP[key]
-            self.cpu.keys[chip8_key] = True
-            self.cpu.key_pressed(chip8_key)
+            with self._cpu_lock:
+                self.cpu.set_key(chip8_key, True)
     
     def _on_key_up(self, event):
         """Handle key release"""
         key = event.keysym.lower()
         if key in KEYBOARD_MAP:
             chip8_key = KEYBOARD_MAP[key]
-            self.cpu.keys[chip8_key] = False
+            with self._cpu_lock:
+                self.cpu.set_key(chip8_key, False)
     
     def _on_controller_key(self, key: int, pressed: bool):
         """Handle controller key change"""
-        self.cpu.keys[key] = pressed
-        if pressed:
-            self.cpu.key_pressed(key)
+        with self._cpu_lock:
+            self.cpu.set_key(key, pressed)
     
     def _setup_controller_callbacks(self):
         """Setup controller action callbacks"""
@@ -928,86 +1116,142 @@ class Chip8GUI:
     def _load_rom(self, filepath: str):
         """Load ROM from file"""
         try:
-            with open(filepath, 'rb') as f:
-                data = f.read()
             name = os.path.basename(filepath)
-            self.cpu.load_rom(data, name)
+            with open(filepath, 'rb') as f:
+                with self._cpu_lock:
+                    self.cpu.load_rom_file(f, name)
             self.rom_label.config(text=f"ROM: {name}")
             self._start_emulation()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load ROM: {e}")
     
     def _start_emulation(self):
-        """Start emulation threads"""
+        """Start emulation thread"""
         if self._emu_running:
             return
         
         self._emu_running = True
         self.running = True
-        self.paused = False
-        self._update_status()
+        self._set_paused(False)
         
         # CPU thread
         self._emu_thread = threading.Thread(target=self._emulation_loop, daemon=True)
         self._emu_thread.start()
         
-        # Timer thread
-        self._timer_thread = threading.Thread(target=self._timer_loop, daemon=True)
-        self._timer_thread.start()
-        
         # Start render loop
+        self._next_render = time.perf_counter()
         self._render_loop()
     
     def _emulation_loop(self):
-        """Main emulation loop running at CPU_FREQUENCY"""
-        cycles_per_frame = (CPU_FREQUENCY * self.speed_multiplier) // TARGET_FPS
+        """Main emulation loop running at CPU_FREQUENCY, ticking the timers"""
+        frame_time = 1 / TARGET_FPS
+        next_frame = time.perf_counter()
+        timer_ticks = 0  # Timer ticks owed, in units of 1/TARGET_FPS
+        crashes = 0  # Consecutive frames that ended in a CPU error
         
         while self._emu_running:
-            if not self.paused:
-                try:
-                    for _ in range(cycles_per_frame):
-                        self.cpu.cycle()
-                except Exception as e:
-                    print(f"CPU Error: {e}")
-                    # Auto-reset after crash
-                    time.sleep(2)
-                    self._reset()
+            if not self._run_event.is_set():
+                # Paused: block without waking until resumed or closed
+                self._run_event.wait()
+                next_frame = time.perf_counter()
+                continue
             
-            # Sleep to maintain timing
-            time.sleep(1 / TARGET_FPS)
-    
-    def _timer_loop(self):
-        """Timer update loop at 60Hz"""
-        while self._emu_running:
-            if not self.paused:
-                self.cpu.update_timers()
-                self.audio.update(self.cpu.sound_timer)
-            time.sleep(1 / TIMER_FREQUENCY)
+            # One batch per frame; re-read so speed changes apply
+            try:
+                with self._cpu_lock:
+                    self.cpu.run_cycles(self._cycles_per_frame)
+                crashes = 0
+            except Exception as e:
+                print(f"CPU Error: {e}")
+                crashes += 1
+                # Stop here; the render loop resets (or pauses) and resumes us
+                self._run_event.clear()
+                self._crashes.put(crashes)
+                if crashes > MAX_AUTO_RESETS:
+                    crashes = 0  # Paused; retry from scratch once resumed
+                continue
+            
+            # Timers run at TIMER_FREQUENCY, whatever the frame rate
+            timer_ticks += TIMER_FREQUENCY
+            with self._cpu_lock:
+                while timer_ticks >= TARGET_FPS:
+                    timer_ticks -= TARGET_FPS
+                    self.cpu.update_timers()
+            self.audio.update(self.cpu.sound_timer)
+            
+            # Sleep until the next frame boundary, without accumulating drift
+            next_frame += frame_time
+            delay = next_frame - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_frame = time.perf_counter()
     
     def _render_loop(self):
         """Render loop for display updates"""
         if not self._emu_running:
             return
         
-        # Render if draw flag set
+        # Recover from CPU crashes reported by the emulation thread
+        if not self._crashes.empty():
+            self._handle_crash(self._crashes.get_nowait())
+        
+        # Render if draw flag set (a hint only; _render re-checks under the lock)
         if self.cpu.draw_flag:
-            self.display_renderer.render(self.cpu.display)
-            self.cpu.draw_flag = False
+            self._request_render()
         
         # Update FPS counter
         self.frame_count += 1
-        now = time.time()
+        now = time.perf_counter()
         if now - self.last_fps_time >= 1.0:
             self.fps = self.frame_count
             self.frame_count = 0
             self.last_fps_time = now
-            self.fps_label.config(text=f"FPS: {self.fps}")
-        
-        # Update controller status
-        self._update_controller_status()
+            if self.fps != self._shown_fps:
+                self._shown_fps = self.fps
+                self.fps_label.config(text=f"FPS: {self.fps}")
+            
+            # Update controller status
+            self._update_controller_status()
         
-        # Schedule next render
-        self.root.after(1000 // TARGET_FPS, self._render_loop)
+        # Schedule next render against a fixed frame deadline
+        self._next_render += 1 / TARGET_FPS
+        delay_ms = int((self._next_render - now) * 1000)
+        if delay_ms > 1:
+            self.root.after(delay_ms, self._render_loop)
+        else:
+            # Already late: run as soon as Tk is idle, resyncing if a frame behind
+            if delay_ms < -1000 // TARGET_FPS:
+                self._next_render = time.perf_counter()
+            self.root.after_idle(self._render_loop)
+    
+    def _handle_crash(self, crashes: int):
+        """Reset after a CPU crash, pausing if it keeps crashing"""
+        # Auto-reset after crash
+        self._reset()
+        if crashes > MAX_AUTO_RESETS:
+            # Crashes straight after every reset; stop retrying
+            self._set_paused(True)
+        elif not self.paused:
+            self._run_event.set()
+    
+    def _request_render(self):
+        """Schedule a repaint; requests before the next idle collapse into one"""
+        if not self._render_pending:
+            self._render_pending = True
+            self.root.after_idle(self._render)
+    
+    def _render(self):
+        """Repaint the display if it changed since the last repaint"""
+        self._render_pending = False
+        # Snapshot under the lock so a frame never mixes two CPU batches and
+        # a draw landing between the flag test and the clear is not lost
+        with self._cpu_lock:
+            if not self.cpu.draw_flag:
+                return
+            self.cpu.draw_flag = False
+            display = list(self.cpu.display)
+        self.display_renderer.render(display)
     
     def _update_controller_status(self):
         """Update controller status in UI"""
@@ -1034,16 +1278,23 @@ class Chip8GUI:
     
     def _reset(self):
         """Reset emulator"""
-        if self.cpu.rom_loaded:
-            # Reload current ROM
-            rom_data = bytes(self.cpu.memory[PROGRAM_START:])
-            name = self.cpu.rom_name
-            self.cpu.load_rom(rom_data, name)
-            self.display_renderer.render(self.cpu.display)
+        with self._cpu_lock:
+            if self.cpu.rom_loaded:
+                # Reload the ROM as originally loaded, not the live memory
+                self.cpu.load_rom(self.cpu.rom_data, self.cpu.rom_name)
+                self.cpu.draw_flag = True  # Picked up by the render loop
     
     def _toggle_pause(self):
         """Toggle pause state"""
-        self.paused = not self.paused
+        self._set_paused(not self.paused)
+    
+    def _set_paused(self, paused: bool):
+        """Pause or resume the emulation thread"""
+        self.paused = paused
+        if paused:
+            self._run_event.clear()
+        else:
+            self._run_event.set()
         self._update_status()
     
     def _save_state(self):
@@ -1051,11 +1302,12 @@ class Chip8GUI:
         if not self.cpu.rom_loaded:
             return
         
-        state = self.cpu.get_state()
+        with self._cpu_lock:
+            data = self.cpu.get_state_bytes()
         save_path = f"{self.cpu.rom_name}.sav"
         try:
             with open(save_path, 'wb') as f:
-                pickle.dump(state, f)
+                f.write(gzip.compress(data))
         except Exception as e:
             print(f"Save failed: {e}")
     
@@ -1067,9 +1319,13 @@ class Chip8GUI:
         save_path = f"{self.cpu.rom_name}.sav"
         try:
             with open(save_path, 'rb') as f:
-                state = pickle.load(f)
-            self.cpu.load_state(state)
-            self.display_renderer.render(self.cpu.display)
+                data = f.read()
+            with self._cpu_lock:
+                if data[:2] == b"\x1f\x8b":
+                    self.cpu.load_state_bytes(gzip.decompress(data))
+                else:
+                    self.cpu.load_state(pickle.loads(data))  # Older pickled saves
+            self._request_render()
         except FileNotFoundError:
             pass  # No save file
         except Exception as e:
@@ -1079,12 +1335,14 @@ class Chip8GUI:
         """Increase emulation speed"""
         if self.speed_multiplier < 8:
             self.speed_multiplier *= 2
+            self._cycles_per_frame = (CPU_FREQUENCY * self.speed_multiplier) // TARGET_FPS
             self._update_status()
     
     def _decrease_speed(self):
         """Decrease emulation speed"""
         if self.speed_multiplier > 1:
             self.speed_multiplier //= 2
+            self._cycles_per_frame = (CPU_FREQUENCY * self.speed_multiplier) // TARGET_FPS
             self._update_status()
     
     def _toggle_scanlines(self):
@@ -1112,6 +1370,7 @@ class Chip8GUI:
     def _on_close(self):
         """Handle window close"""
         self._emu_running = False
+        self._run_event.set()  # Wake a paused emulation thread so it exits
         self.controller.stop()
         self.audio.stop_beep()
         self.root.destroy()
@@ -0,0 +1,109 @@
+"""Save-state compatibility tests for chip8_complete"""
+
+import gzip
+import pickle
+import unittest
+
+import chip8_complete as c8
+
+
+def baseline_state(cpu: c8.Chip8CPU) -> c8.EmulatorState:
+    """
+    Build a state shaped like the saves written before the flat
+    framebuffer: V as a list, display as one list of pixels per row,
+    and no rng_state field (as unpickling such a save produces).
+    """
+    cfg = cpu.config
+    display = [[0] * cfg.hires_width for _ in range(cfg.hires_height)]
+    display[0][0] = 1
+    display[5][63] = 1
+    display[31][10] = 1
+
+    state = c8.EmulatorState.__new__(c8.EmulatorState)
+    state.__dict__.update(
+        memory=bytes(cpu.memory),
+        v=list(range(16)),
+        i=0x300,
+        pc=0x208,
+        stack=[0x202] + [0] * (cfg.stack_size - 1),
+        sp=1,
+        delay_timer=7,
+        sound_timer=3,
+        display=display,
+        keys=[False] * 16,
+        hires_mode=False,
+        rpl_flags=[0] * 16,
+    )
+    return state
+
+
+class LoadStateTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cpu = c8.Chip8CPU(c8.EmulatorConfig())
+        self.cpu.load_rom(bytes.fromhex("6001 6102 1204".replace(" ", "")), "test")
+
+    def test_baseline_display_rows(self):
+        """List-of-rows display is copied into the flat framebuffer"""
+        cpu = self.cpu
+        cpu.load_state(baseline_state(cpu))
+
+        lit = [idx for idx, px in enumerate(cpu.display) if px]
+        self.assertEqual(lit, [0, 5 * cpu.stride + 63, 31 * cpu.stride + 10])
+        self.assertEqual(len(cpu.display), cpu.config.hires_width * cpu.config.hires_height)
+        self.assertEqual(list(cpu.v), list(range(16)))
+        self.assertEqual((cpu.pc, cpu.i, cpu.sp), (0x208, 0x300, 1))
+
+    def test_baseline_state_runs(self):
+        """CPU keeps running and drawing after loading an older state"""
+        cpu = self.cpu
+        cpu.load_state(baseline_state(cpu))
+        cpu.memory[0x208:0x20C] = bytes.fromhex("D015 1208".replace(" ", ""))
+        cpu.run_batch(4)
+        self.assertFalse(cpu.halted)
+
+    def test_round_trip(self):
+        """Current states load back unchanged"""
+        cpu = self.cpu
+        cpu.run_batch(3)
+        state = cpu.get_state()
+
+        other = c8.Chip8CPU(c8.EmulatorConfig())
+        other.load_state(state)
+        self.assertEqual(other.get_state(), state)
+
+
+class SaveFileTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cpu = c8.Chip8CPU(c8.EmulatorConfig())
+        self.cpu.load_rom(bytes.fromhex("6001 6102 1204".replace(" ", "")), "test")
+
+    def test_plain_pickle_save(self):
+        """Uncompressed pickles of older states still load"""
+        cpu = self.cpu
+        cpu.load_state_bytes(pickle.dumps(baseline_state(cpu)))
+        self.assertEqual(cpu.display[5 * cpu.stride + 63], 1)
+        self.assertEqual(cpu.delay_timer, 7)
+
+    def test_gzip_pickle_save(self):
+        """Compressed pickles of older states load too"""
+        cpu = self.cpu
+        cpu.load_state_bytes(gzip.compress(pickle.dumps(baseline_state(cpu))))
+        self.assertEqual(cpu.display[31 * cpu.stride + 10], 1)
+        self.assertEqual(cpu.pc, 0x208)
+
+    def test_save_file_round_trip(self):
+        """Saved file contents restore the same state"""
+        cpu = self.cpu
+        cpu.run_batch(3)
+        data = cpu.get_state_bytes()
+        self.assertEqual(data[:2], b"\x1f\x8b")
+
+        other = c8.Chip8CPU(c8.EmulatorConfig())
+        other.load_state_bytes(data)
+        self.assertEqual(other.get_state(), cpu.get_state())
+
+
+if __name__ == "__main__":
+    unittest.main()